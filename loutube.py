@@ -1,26 +1,59 @@
 #!/usr/bin/env python3
 import os
 import subprocess
-import urllib.parse
 import sys
-import platform
 import signal
 import time
 import json
 import re
-import glob
 import shutil
+import functools
+import threading
 from pathlib import Path
+from types import MappingProxyType
 
 # Global cache for browser cookies
 _cached_browser_cookies = None
 _cookies_checked = False
+_cookies_lock = threading.Lock()
+_cookies_notice = None  # "Using cookies from ..." message not yet shown
+
+# Global cache for the yt-dlp config file location
+_cached_config_file = None
+_config_checked = False
+
+# Global cache for NVENC split-frame encoding support
+_nvenc_split_encode_value = None
+_nvenc_split_encode_checked = False
+
+# Tool and ffmpeg feature probes, each resolved once per process
+_CAPS = {}
+_TOOL_VERSIONS = {}
+
+# yt-dlp's Python API (None if it can't be imported) and metadata fetched through it, by URL
+_yt_dlp_module = None
+_yt_dlp_checked = False
+_video_info_cache = {}
+
+# On-disk caches shared across runs
+LOUTUBE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "loutube")
+METADATA_CACHE_PATH = os.path.join(LOUTUBE_CACHE_DIR, "meta.sqlite")
+COOKIE_CACHE_PATH = os.path.join(LOUTUBE_CACHE_DIR, "cookies.json")
+_metadata_db = None
+_metadata_db_checked = False
+
+# Output/cache directories already created this run
+_ensured_dirs = set()
 
 YOUTUBE_HOST_SUFFIXES = (
     "youtube.com",
     "youtube-nocookie.com",
 )
 
+# Explicit libx264 threading; left on auto, x264 starts 1.5x the logical core count and oversubscribes
+X264_THREADS = max(1, min(8, os.cpu_count() or 4))
+X264_THREAD_ARGS = ("-threads", str(X264_THREADS), "-thread_type", "frame")
+
 def draw_progress_counter(percentage, speed="", eta="", downloaded="", total=""):
     """Display a simple percentage counter on a single line."""
     # Clamp percentage to 0-100 range
@@ -142,6 +175,10 @@ def run_with_progress_counter(command, cwd=None):
         # Wait for process to complete
         process.wait()
         
+        # A failed run that used saved browser cookies may mean that choice went stale
+        if process.returncode != 0 and "--cookies-from-browser" in command:
+            _forget_cookie_cache()
+        
         # Print final newline after progress counter
         if had_progress:
             sys.stdout.write("\n")
@@ -157,6 +194,64 @@ def run_with_progress_counter(command, cwd=None):
         sys.stdout.flush()
         draw_progress_counter._prev_length = 0
         raise
+def run_ffmpeg_with_progress(cmd, duration_seconds=0):
+    """Run an ffmpeg command, showing its -progress output as a single-line counter.
+    
+    duration_seconds is the expected output duration; without it only fps/speed are shown.
+    Raises CalledProcessError on failure, like subprocess.run(check=True).
+    """
+    # Machine-readable progress on stderr replaces the stats line; only real errors are logged
+    cmd = [cmd[0], "-hide_banner", "-loglevel", "error", "-nostats", "-progress", "pipe:2", *cmd[1:]]
+    process = subprocess.Popen(cmd, stderr=subprocess.PIPE, text=True, bufsize=1)
+    
+    draw_progress_counter._prev_length = 0
+    stats = {}
+    errors = []
+    
+    try:
+        for line in process.stderr:
+            key, sep, value = line.strip().partition("=")
+            if not sep:
+                if line.strip():
+                    errors.append(line.strip())
+                continue
+            stats[key] = value
+            
+            # Each progress block ends with a progress=continue/end line
+            if key != "progress":
+                continue
+            out_time = stats.get("out_time_us", "")
+            out_seconds = int(out_time) / 1_000_000 if out_time.isdigit() else 0
+            speed = stats.get("speed", "").strip()
+            if value == "end":
+                percentage = 100.0
+            else:
+                percentage = out_seconds / duration_seconds * 100 if duration_seconds else 0
+            eta = ""
+            if duration_seconds and speed.endswith("x"):
+                try:
+                    remaining = (duration_seconds - out_seconds) / float(speed[:-1])
+                    eta = f"{int(remaining // 60):02d}:{int(remaining % 60):02d}"
+                except (ValueError, ZeroDivisionError):
+                    pass
+            draw_progress_counter(percentage, speed=f"{stats.get('fps', '0')} fps ({speed or 'N/A'})", eta=eta)
+        
+        process.wait()
+    except KeyboardInterrupt:
+        process.terminate()
+        process.wait()
+        raise
+    finally:
+        if draw_progress_counter._prev_length:
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+            draw_progress_counter._prev_length = 0
+    
+    for error in errors:
+        print(error)
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd, stderr="\n".join(errors))
+
 def _normalize_host(netloc):
     """Return lower-cased host without credentials or port."""
     if not netloc:
@@ -173,8 +268,9 @@ def is_youtube_url(url):
     """Return True if URL points to a YouTube-owned domain."""
     if not url:
         return False
+    from urllib.parse import urlparse
     try:
-        parsed = urllib.parse.urlparse(url)
+        parsed = urlparse(url)
     except Exception:
         return False
 
@@ -199,91 +295,197 @@ def get_brave_snap_path():
     and finding the active Brave snap profile.
     Returns the Brave browser path or None if not found.
     """
+    # Snap keeps one directory per revision (plus "common" and a "current" symlink)
+    snap_dir = os.path.join(Path.home(), "snap", "brave")
     try:
-        # Get current user's home directory
-        home_dir = str(Path.home())
-        
-        # Look for Brave snap directories (they have version numbers)
-        brave_snap_pattern = os.path.join(home_dir, "snap", "brave", "*", ".config", "BraveSoftware", "Brave-Browser", "Default")
-        brave_paths = glob.glob(brave_snap_pattern)
-        
-        if brave_paths:
-            # Sort by version number (highest first) and return the most recent
-            brave_paths.sort(key=lambda x: int(x.split("/")[-5]) if x.split("/")[-5].isdigit() else 0, reverse=True)
-            # Format as brave:path for yt-dlp
-            return f"brave:{brave_paths[0]}"
-        
-        return None
-    except (ImportError, IndexError, ValueError, OSError):
+        with os.scandir(snap_dir) as entries:
+            revisions = [entry for entry in entries
+                         if entry.name.isdigit() and entry.is_dir(follow_symlinks=False)]
+    except OSError:
         return None
+    
+    # Most recent revision first; format as brave:path for yt-dlp
+    for entry in sorted(revisions, key=lambda e: int(e.name), reverse=True):
+        profile = os.path.join(entry.path, ".config", "BraveSoftware", "Brave-Browser", "Default")
+        if os.path.isdir(profile):
+            return f"brave:{profile}"
+    return None
 
-def get_browser_cookies_fast():
-    """
-    Quickly find available browser cookies using a much faster method.
-    Returns the browser cookie string for yt-dlp, or None if none found.
+def get_chromium_snap_path():
+    """Return the Chromium snap's profile root as chromium:path for yt-dlp, or None if not found.
+
+    yt-dlp only looks in ~/.config/chromium for a bare "chromium", so the snap has to be named by path.
     """
-    global _cached_browser_cookies, _cookies_checked
-    
-    # Return cached result if already checked
-    if _cookies_checked:
-        return _cached_browser_cookies
-    
-    system = platform.system().lower()
-    
-    # Common browser paths by OS  
-    browser_paths = {
-        'linux': [  # Linux
-            ('brave-snap', get_brave_snap_path()),  # Generic Brave snap path (try first)
-            ('brave', 'brave'),
-            ('firefox', 'firefox'),
-            ('chrome', 'chrome'),
-            ('chromium', 'chromium'),
-            ('edge', 'edge'),
-        ],
-        'darwin': [  # macOS
-            ('firefox', 'firefox'),
-            ('chrome', 'chrome'),
-            ('brave', 'brave'),
-            ('safari', 'safari'),
-            ('edge', 'edge'),
-        ],
-        'windows': [  # Windows
-            ('firefox', 'firefox'),
-            ('chrome', 'chrome'),
-            ('brave', 'brave'),
-            ('edge', 'edge'),
-        ]
-    }
-    
-    if system not in browser_paths:
-        _cookies_checked = True
+    root = os.path.join(Path.home(), "snap", "chromium", "common", "chromium")
+    return f"chromium:{root}" if os.path.isdir(root) else None
+
+def _windows_profile_path(env_var, *parts):
+    """Join parts onto a Windows profile directory, or None if the variable is unset."""
+    base = os.environ.get(env_var)
+    return os.path.join(base, *parts) if base else None
+
+# Where each browser keeps its profiles, by OS. Firefox entries are the directory holding
+# one folder per profile; Safari entries are the cookie files themselves.
+_MAC_APP_SUPPORT = os.path.join(Path.home(), "Library", "Application Support")
+BROWSER_PROFILE_PATHS = MappingProxyType({
+    ('linux', 'brave'): [os.path.join(Path.home(), ".config", "BraveSoftware", "Brave-Browser")],
+    ('linux', 'firefox'): [os.path.join(Path.home(), ".mozilla", "firefox"),
+                           os.path.join(Path.home(), "snap", "firefox", "common", ".mozilla", "firefox")],
+    ('linux', 'chrome'): [os.path.join(Path.home(), ".config", "google-chrome")],
+    ('linux', 'chromium'): [os.path.join(Path.home(), ".config", "chromium")],
+    ('linux', 'edge'): [os.path.join(Path.home(), ".config", "microsoft-edge")],
+    ('darwin', 'firefox'): [os.path.join(_MAC_APP_SUPPORT, "Firefox", "Profiles")],
+    ('darwin', 'chrome'): [os.path.join(_MAC_APP_SUPPORT, "Google", "Chrome")],
+    ('darwin', 'brave'): [os.path.join(_MAC_APP_SUPPORT, "BraveSoftware", "Brave-Browser")],
+    ('darwin', 'safari'): [os.path.join(Path.home(), "Library", "Cookies", "Cookies.binarycookies"),
+                           os.path.join(Path.home(), "Library", "Containers", "com.apple.Safari",
+                                        "Data", "Library", "Cookies", "Cookies.binarycookies")],
+    ('darwin', 'edge'): [os.path.join(_MAC_APP_SUPPORT, "Microsoft Edge")],
+    ('windows', 'firefox'): [_windows_profile_path("APPDATA", "Mozilla", "Firefox", "Profiles")],
+    ('windows', 'chrome'): [_windows_profile_path("LOCALAPPDATA", "Google", "Chrome", "User Data")],
+    ('windows', 'brave'): [_windows_profile_path("LOCALAPPDATA", "BraveSoftware", "Brave-Browser", "User Data")],
+    ('windows', 'edge'): [_windows_profile_path("LOCALAPPDATA", "Microsoft", "Edge", "User Data")],
+})
+
+# Browsers to take cookies from, in order of preference, by OS: (name, yt-dlp browser key)
+BROWSER_CANDIDATES = MappingProxyType({
+    'linux': (
+        ('brave', 'brave'),
+        ('firefox', 'firefox'),
+        ('chrome', 'chrome'),
+        ('chromium', 'chromium'),
+        ('edge', 'edge'),
+    ),
+    'darwin': (
+        ('firefox', 'firefox'),
+        ('chrome', 'chrome'),
+        ('brave', 'brave'),
+        ('safari', 'safari'),
+        ('edge', 'edge'),
+    ),
+    'windows': (
+        ('firefox', 'firefox'),
+        ('chrome', 'chrome'),
+        ('brave', 'brave'),
+        ('edge', 'edge'),
+    ),
+})
+
+# Cookie database inside a Chromium-based browser's profile folder (newer builds use Network/)
+CHROMIUM_COOKIE_FILES = (("Network", "Cookies"), ("Cookies",))
+
+def _chromium_profile_has_cookies(path):
+    """Return True if a Chromium-based profile folder holds a cookie database."""
+    return any(os.path.isfile(os.path.join(path, *parts)) for parts in CHROMIUM_COOKIE_FILES)
+
+def _profile_has_cookies(browser_name, path):
+    """Return True if a cookie database exists under one browser profile location."""
+    if browser_name == 'safari':
+        return os.path.isfile(path)
+    if browser_name == 'firefox':
+        # One folder per Firefox profile, each with its own cookies.sqlite
+        try:
+            with os.scandir(path) as entries:
+                return any(entry.is_dir() and os.path.isfile(os.path.join(entry.path, "cookies.sqlite"))
+                           for entry in entries)
+        except OSError:
+            return False
+    # Chromium-based: either a profile folder itself, or the root holding Default, Profile 1, ...
+    # (yt-dlp reads the newest cookie database across all of them)
+    if _chromium_profile_has_cookies(path):
+        return True
+    try:
+        with os.scandir(path) as entries:
+            return any(entry.is_dir() and _chromium_profile_has_cookies(entry.path) for entry in entries)
+    except OSError:
+        return False
+
+def _browser_has_cookies(system, browser_name, browser_key):
+    """Return True if the browser has a cookie database on disk for yt-dlp to read."""
+    if ":" in browser_key:
+        # Explicit location: the Brave snap profile folder or the Chromium snap profile root
+        browser, path = browser_key.split(":", 1)
+        return _profile_has_cookies(browser, path)
+    roots = BROWSER_PROFILE_PATHS.get((system, browser_name), ())
+    return any(root and _profile_has_cookies(browser_name, root) for root in roots)
+
+def _load_cookie_cache():
+    """Return the browser cookie choice saved by a previous run, or None."""
+    try:
+        with open(COOKIE_CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
         return None
+
+def _save_cookie_cache(system, browser_name, browser_key):
+    """Remember the working browser cookie choice for later runs."""
+    try:
+        _ensure_dir(LOUTUBE_CACHE_DIR)
+        with open(COOKIE_CACHE_PATH, 'w') as f:
+            json.dump({'system': system, 'browser_name': browser_name, 'browser': browser_key}, f)
+    except OSError:
+        pass
+
+def _forget_cookie_cache():
+    """Drop the saved cookie choice so the next run probes browsers again."""
+    try:
+        os.remove(COOKIE_CACHE_PATH)
+    except OSError:
+        pass
+
+def _detect_browser_cookies():
+    """Return (browser cookie string for yt-dlp or None, message describing the result)."""
+    import platform
+    system = platform.system().lower()
     
-    # Quick test - just check if yt-dlp recognizes the browser option (much faster than full simulation)
-    for browser_name, browser_key in browser_paths[system]:
-        # Skip if browser_key is None (e.g., when Brave snap path not found)
+    # Reuse the browser a previous run settled on, as long as its cookies are still there
+    cached = _load_cookie_cache()
+    if (isinstance(cached, dict) and cached.get('system') == system and cached.get('browser')
+            and _browser_has_cookies(system, cached.get('browser_name', ''), cached['browser'])):
+        return cached['browser'], f"Using cookies from {cached.get('browser_name', cached['browser'])}"
+    
+    candidates = BROWSER_CANDIDATES.get(system)
+    if candidates is None:
+        return None, None
+    if system == 'linux':
+        # Generic Brave snap path (try first); its versioned directory has to be looked up.
+        # The Chromium snap is passed by path too, since yt-dlp doesn't search ~/snap itself.
+        candidates = ((('brave-snap', get_brave_snap_path()),) + candidates
+                      + (('chromium-snap', get_chromium_snap_path()),))
+    
+    # Pick the first browser with a cookie database on disk - a few stat() calls, no subprocesses
+    for browser_name, browser_key in candidates:
+        # Skip if browser_key is None (e.g., when a snap path was not found)
         if browser_key is None:
             continue
-            
-        try:
-            # Just test if yt-dlp accepts the browser option
-            test_command = [
-                "yt-dlp", 
-                "--cookies-from-browser", browser_key,
-                "--version"  # This just tests if the browser option is valid, returns immediately
-            ]
-            result = subprocess.run(test_command, capture_output=True, text=True, timeout=2)
-            if result.returncode == 0:
-                print(f"Using cookies from {browser_name}")
-                _cached_browser_cookies = browser_key
-                _cookies_checked = True
-                return browser_key
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
-            continue
+        
+        if _browser_has_cookies(system, browser_name, browser_key):
+            _save_cookie_cache(system, browser_name, browser_key)
+            return browser_key, f"Using cookies from {browser_name}"
     
-    print("Warning: Could not find browser cookies. Some videos may be unavailable.")
-    _cookies_checked = True
-    return None
+    return None, "Warning: Could not find browser cookies. Some videos may be unavailable."
+
+def get_browser_cookies_fast(announce=True):
+    """
+    Quickly find available browser cookies using a much faster method.
+    Returns the browser cookie string for yt-dlp, or None if none found.
+    With announce=False the result message is held back until the next announcing call.
+    """
+    global _cached_browser_cookies, _cookies_checked, _cookies_notice
+    
+    # The lock also makes callers wait for a background lookup that is still running
+    with _cookies_lock:
+        if not _cookies_checked:
+            _cached_browser_cookies, _cookies_notice = _detect_browser_cookies()
+            _cookies_checked = True
+        if announce and _cookies_notice:
+            print(_cookies_notice)
+            _cookies_notice = None
+        return _cached_browser_cookies
+
+def preload_browser_cookies():
+    """Start looking for browser cookies in the background while the user reads the menu."""
+    threading.Thread(target=get_browser_cookies_fast, kwargs={'announce': False}, daemon=True).start()
 
 def get_browser_cookies():
     """Legacy function name - calls the fast version"""
@@ -304,6 +506,12 @@ DEFAULT_MUSIC_DIR = os.path.join(Path.home(), "Music", "ytd-music")
 
 def find_config_file():
     """Find the yt-dlp configuration file."""
+    global _cached_config_file, _config_checked
+    
+    # Return cached result if already checked
+    if _config_checked:
+        return _cached_config_file
+    
     script_dir = os.path.dirname(os.path.abspath(__file__))
     config_locations = [
         # Portable config (same directory as script)
@@ -317,10 +525,9 @@ def find_config_file():
         "/etc/yt-dlp.conf"
     ]
     
-    for config_path in config_locations:
-        if os.path.exists(config_path):
-            return config_path
-    return None
+    _cached_config_file = next((p for p in config_locations if os.path.exists(p)), None)
+    _config_checked = True
+    return _cached_config_file
 
 def build_base_command(url):
     command = ["yt-dlp"]
@@ -378,11 +585,29 @@ def build_streaming_command(url):
     
     return add_browser_cookies(command, url)
 
+# A non-empty list= query parameter marks a playlist URL
+PLAYLIST_PARAM_RE = re.compile(r"[?&]list=[^&#]")
+
+@functools.lru_cache(maxsize=128)
 def is_playlist(url):
     """Check if URL is a playlist."""
-    parsed = urllib.parse.urlparse(url)
-    query_params = urllib.parse.parse_qs(parsed.query)
-    return "list" in query_params
+    return PLAYLIST_PARAM_RE.search(url) is not None
+
+# Parallel fragment fetching for DASH/HLS downloads, and chunked requests for plain HTTP ones
+CONCURRENT_FRAGMENTS = 4
+HTTP_CHUNK_SIZE = "10M"
+FRAGMENT_DOWNLOAD_ARGS = ("--concurrent-fragments", str(CONCURRENT_FRAGMENTS), "--http-chunk-size", HTTP_CHUNK_SIZE)
+
+def _ensure_dir(path):
+    """Create path (and parents) once per run; later calls for the same path are free."""
+    if path not in _ensured_dirs:
+        os.makedirs(path, exist_ok=True)
+        _ensured_dirs.add(path)
+
+def _out_template(base, title=None, suffix=""):
+    """Return a yt-dlp output template in base, named after title or the video's own title."""
+    stem = f"{title}{suffix}" if title else f"%(title)s{suffix}"
+    return os.path.join(base, f"{stem}.%(ext)s")
 
 def sanitize_filename(filename):
     """Sanitize filename by removing or replacing invalid characters."""
@@ -509,6 +734,82 @@ def detect_album_pattern(title, uploader):
     
     return False
 
+def _get_yt_dlp():
+    """Return the yt_dlp module if this interpreter can import it, else None."""
+    global _yt_dlp_module, _yt_dlp_checked
+    if not _yt_dlp_checked:
+        _yt_dlp_checked = True
+        try:
+            import yt_dlp
+            if hasattr(yt_dlp, "parse_options"):
+                _yt_dlp_module = yt_dlp
+        except ImportError:
+            pass
+    return _yt_dlp_module
+
+def fetch_video_info(url, timeout=15):
+    """Return yt-dlp's metadata for url (as --dump-json prints it), or None on failure.
+    
+    Runs yt-dlp in-process when its Python API is importable, otherwise spawns it.
+    Results are kept for the rest of the run, so repeated lookups are free.
+    """
+    if url in _video_info_cache:
+        return _video_info_cache[url]
+    
+    # Callers want a single video's metadata, even for watch?v=...&list=... URLs
+    command = build_base_command(url) + ["--no-playlist"]
+    info = None
+    yt_dlp = _get_yt_dlp()
+    try:
+        # Same options (config file, cookies) the command line would use
+        ydl_opts = yt_dlp.parse_options(command[1:] + [url]).ydl_opts if yt_dlp else None
+    except (Exception, SystemExit):
+        ydl_opts = None
+    
+    if ydl_opts is not None:
+        ydl_opts.update(quiet=True, no_warnings=True, noprogress=True, skip_download=True)
+        # parse_options always sets socket_timeout, to None unless the config gives one
+        if ydl_opts.get("socket_timeout") is None:
+            ydl_opts["socket_timeout"] = timeout
+        try:
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                info = ydl.sanitize_info(ydl.extract_info(url, download=False))
+        except Exception:
+            info = None
+    else:
+        command.extend(["--dump-json", "--no-download", url])
+        import tempfile
+        try:
+            # yt-dlp writes the JSON straight into a file that is parsed from disk
+            with tempfile.TemporaryFile("w+") as out:
+                result = subprocess.run(command, stdout=out, stderr=subprocess.DEVNULL, timeout=timeout)
+                if result.returncode == 0:
+                    out.seek(0)
+                    info = json.load(out)
+        except (subprocess.TimeoutExpired, FileNotFoundError, OSError, ValueError):
+            info = None
+    
+    if info is not None:
+        _video_info_cache[url] = info
+    return info
+
+def write_cached_info_json(url):
+    """Save already-fetched metadata for url to a temp .info.json, or return None if there is none.
+    
+    Passing the file to yt-dlp with --load-info-json skips its own metadata request.
+    The caller is responsible for deleting the file.
+    """
+    info = _video_info_cache.get(url)
+    if not info:
+        return None
+    import tempfile
+    try:
+        with tempfile.NamedTemporaryFile("w", suffix=".info.json", delete=False) as f:
+            json.dump(info, f)
+            return f.name
+    except (OSError, TypeError, ValueError):
+        return None
+
 def generate_auto_folder_name(url):
     """Generate folder name automatically based on playlist/video information."""
     if not is_playlist(url):
@@ -539,20 +840,11 @@ def generate_auto_folder_name(url):
 
 def get_single_video_info(url):
     """Get information for a single video."""
-    command = build_base_command(url)
-    command.extend([
-        "--dump-json",
-        "--no-download",
-        url
-    ])
-    
     try:
-        result = subprocess.run(command, capture_output=True, text=True, timeout=15)
-        
-        if result.returncode != 0:
+        video_data = fetch_video_info(url)
+        if not video_data:
             return "Unknown Video"
         
-        video_data = json.loads(result.stdout)
         title = video_data.get('title', 'Unknown Video')
         uploader = video_data.get('uploader', '')
         
@@ -561,22 +853,15 @@ def get_single_video_info(url):
         else:
             return sanitize_filename(title)
             
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, Exception):
+    except Exception:
         return "Unknown Video"
 
 def is_live_stream(url):
     """Return True if the given URL refers to a live stream (according to yt-dlp metadata)."""
-    command = build_base_command(url)
-    command.extend([
-        "--dump-json",
-        "--no-download",
-        url
-    ])
     try:
-        result = subprocess.run(command, capture_output=True, text=True, timeout=15)
-        if result.returncode != 0 or not result.stdout:
+        data = fetch_video_info(url)
+        if not data:
             return False
-        data = json.loads(result.stdout)
         # yt-dlp may use 'is_live' or 'live_status' fields
         if data.get('is_live') is True:
             return True
@@ -598,7 +883,7 @@ def get_direct_stream_url(url):
     command = add_browser_cookies(command, url)
     command.extend(["-g", url])
     try:
-        result = subprocess.run(command, capture_output=True, text=True, timeout=10)
+        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=10)
         if result.returncode != 0:
             return None
         # yt-dlp may print one or multiple lines; pick the first non-empty
@@ -610,110 +895,108 @@ def get_direct_stream_url(url):
     except Exception:
         return None
 
-def list_formats(url):
-    """List available formats for a video, filtering out m3u8 and mp4 formats and unwanted columns."""
-    command = build_streaming_command(url)
-    command.extend(["--list-formats", url])
-    
-    try:
-        result = subprocess.run(command, capture_output=True, text=True, check=True, timeout=30)
-        # Filter out m3u8 format from the output and format columns
-        filtered_lines = []
-        for line in result.stdout.split('\n'):
-            if ('m3u8' not in line.lower()) or 'ID' in line or 'format code' in line.lower() or '---' in line:
-                # Parse and filter columns for each line
-                filtered_line = filter_format_columns(line)
-                if filtered_line:
-                    filtered_lines.append(filtered_line)
-        return '\n'.join(filtered_lines)
-    except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
-        print(f"Error: Failed to list formats.\n{e}")
-        return None
+FORMAT_TABLE_HEADER = ("ID       FILESIZE    VCODEC       ACODEC       MORE\n"
+                       "---      --------    ------       ------       ----")
 
-def filter_format_columns(line):
-    """Filter format line to show only ID, FILESIZE, VCODEC, ACODEC, and MORE columns."""
-    # Skip empty lines
-    if not line.strip():
+def _format_filesize(fmt):
+    """Return a format's size as yt-dlp shows it (e.g. '12.34MiB', '~ 3.10MiB'), or ''."""
+    size = fmt.get('filesize')
+    prefix = ""
+    if not size:
+        size = fmt.get('filesize_approx')
+        prefix = "~"
+    if not size:
         return ""
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024 or unit == "GiB":
+            break
+        size /= 1024
+    return f"{prefix}{size:.2f}{unit}"
+
+def list_formats(url):
+    """List available formats for a video, filtering out m3u8 formats and unwanted columns."""
+    info = fetch_video_info(url, timeout=30)
+    if info and info.get('_type') == 'playlist':
+        # A bare playlist URL has no formats of its own; only its entries do
+        print("Error: This is a playlist URL. Use a single video's URL to list formats.")
+        return None
+    if not info or not info.get('formats'):
+        print("Error: Failed to list formats.")
+        return None
     
-    # Handle header line
-    if 'ID' in line and 'FILESIZE' in line:
-        # Create simplified header
-        return "ID       FILESIZE    VCODEC       ACODEC       MORE"
-    
-    # Handle separator line
-    if '---' in line:
-        return "---      --------    ------       ------       ----"
-    
-    # Parse yt-dlp format which uses pipe separators | (2025 releases also use box characters)
-    # Format: ID EXT RESOLUTION FPS CH | FILESIZE TBR PROTO | VCODEC VBR ACODEC ABR ASR MORE INFO
-    try:
-        parsed_line = line.replace('│', '|')
-        # Split by pipe separators
-        if '|' in parsed_line:
-            sections = parsed_line.split('|')
-            if len(sections) >= 3:
-                # Section 1: ID EXT RESOLUTION FPS CH
-                first_section = sections[0].strip().split()
-                id_part = first_section[0] if len(first_section) > 0 else ""
-                
-                # Section 2: FILESIZE TBR PROTO
-                second_section = sections[1].strip().split()
-                filesize_part = second_section[0] if len(second_section) > 0 else ""
-                
-                # Section 3: VCODEC VBR ACODEC ABR ASR MORE INFO
-                third_section = sections[2].strip().split()
-                vcodec_part = third_section[0] if len(third_section) > 0 else ""
-                acodec_part = third_section[2] if len(third_section) > 2 else ""
-                
-                # More info is everything after ABR ASR (positions 3+)
-                more_parts = " ".join(third_section[4:]) if len(third_section) > 4 else ""
-                
-                # Format the output with consistent spacing
-                return f"{id_part:<8} {filesize_part:<11} {vcodec_part:<12} {acodec_part:<12} {more_parts}"
-        
-        # If no pipes found, return original line (might be a different format)
-        return line
-        
-    except (IndexError, ValueError):
-        return line  # Return original line if parsing fails
+    # Work on yt-dlp's format records directly rather than its printed table
+    lines = [FORMAT_TABLE_HEADER]
+    for fmt in info['formats']:
+        if 'm3u8' in (fmt.get('protocol') or ''):
+            continue
+        vcodec = fmt.get('vcodec') or ''
+        acodec = fmt.get('acodec') or ''
+        if vcodec == 'none' and acodec != 'none':
+            vcodec = 'audio only'
+        elif acodec == 'none' and vcodec != 'none':
+            acodec = 'video only'
+        resolution = fmt.get('resolution') if vcodec != 'audio only' else None
+        more = " ".join(str(part) for part in (fmt.get('ext'), resolution, fmt.get('format_note')) if part)
+        lines.append(f"{fmt.get('format_id', ''):<8} {_format_filesize(fmt):<11} {vcodec:<12} {acodec:<12} {more}")
+    return "\n".join(lines)
     
 def check_vlc_compatibility():
     """Check if VLC is available for streaming."""
-    try:
-        # Simple VLC availability check
-        result = subprocess.run(
-            ["vlc", "--version"], 
-            capture_output=True, 
-            text=True, 
-            timeout=5
-        )
-        
-        if result.returncode == 0:
-            return True, "VLC is available for streaming"
-        else:
-            return False, "VLC not responding properly"
-            
-    except subprocess.TimeoutExpired:
-        return False, "VLC response timeout"
-    except FileNotFoundError:
+    # A PATH lookup is enough before streaming; only show_config runs `vlc --version`
+    if not _cap("vlc"):
         return False, "VLC not found - please install VLC media player"
-    except Exception as e:
-        return False, f"VLC check failed: {str(e)}"
+    return True, "VLC is available for streaming"
+
+# Requested size of the yt-dlp -> player pipe; Linux caps it at /proc/sys/fs/pipe-max-size
+STREAM_PIPE_SIZE = 1 << 20
+
+# VLC input buffering for streams (its defaults hold back roughly a second of video)
+VLC_LATENCY_MS = 200
+VLC_LOW_LATENCY_ARGS = (
+    f"--network-caching={VLC_LATENCY_MS}",
+    f"--file-caching={VLC_LATENCY_MS}",
+    "--clock-jitter=0",
+    "--clock-synchro=0",
+)
+
+# Stream players in order of preference, with their low-latency flags; the source goes last
+STREAM_PLAYERS = (
+    ("mpv", ("--cache=no", "--profile=low-latency")),
+    ("ffplay", ("-fflags", "nobuffer", "-flags", "low_delay", "-framedrop", "-autoexit", "-i")),
+    ("vlc", ("--no-video-title-show", "--avcodec-hw=none", *VLC_LOW_LATENCY_ARGS)),
+)
+
+def _pick_player():
+    """Return (name, args) for the first installed stream player, defaulting to VLC."""
+    for name, args in STREAM_PLAYERS:
+        if _cap(name):
+            return name, args
+    return STREAM_PLAYERS[-1]
+
+def _enlarge_pipe(pipe, size=STREAM_PIPE_SIZE):
+    """Grow a pipe's kernel buffer on Linux so large streams need fewer read/write calls."""
+    if not sys.platform.startswith("linux"):
+        return
+    import fcntl
+    try:
+        fcntl.fcntl(pipe.fileno(), getattr(fcntl, "F_SETPIPE_SZ", 1031), size)
+    except OSError:
+        # Over the system limit or unsupported: keep the default buffer
+        pass
 
 def watch_video(url):
-    """Stream video at selected quality using VLC."""
+    """Stream video at selected quality using the best available player (mpv, ffplay or VLC)."""
     print("Fetching available formats...")
     formats_output = list_formats(url)
 
     # Detect live streams and provide recording options
     live = is_live_stream(url)
     if live:
-        print("\nDetected a live stream!")
-        print("Options for live streams:")
-        print("  1) Open direct stream URL in VLC (may be lower latency)")
-        print("  2) Record the live stream from its start (if available) using yt-dlp --live-from-start")
-        print("  3) Start recording from now (begin recording current live session)")
+        sys.stdout.write("\nDetected a live stream!\n"
+                         "Options for live streams:\n"
+                         "  1) Open direct stream URL in the player (may be lower latency)\n"
+                         "  2) Record the live stream from its start (if available) using yt-dlp --live-from-start\n"
+                         "  3) Start recording from now (begin recording current live session)\n")
         choice = safe_input("Enter choice (1-3): ").strip()
         if not choice:
             choice = "1"
@@ -727,12 +1010,10 @@ def watch_video(url):
         print("Could not retrieve format list. Using config file default.")
         format_code = None  # Let config file handle default
     else:
-        print("\nAvailable formats:")
-        print(formats_output)
-
-        print("\nEnter format selection:")
-        print("- Enter a specific format ID (e.g., '137+140' for video+audio from the ID column)")        
-        print("- Press enter to select the highest quality video & audio.")
+        sys.stdout.write(f"\nAvailable formats:\n{formats_output}\n\n"
+                         "Enter format selection:\n"
+                         "- Enter a specific format ID (e.g., '137+140' for video+audio from the ID column)\n"
+                         "- Press enter to select the highest quality video & audio.\n")
         user_format = safe_input("\nFormat choice: ").strip()
 
         if not user_format:
@@ -745,24 +1026,25 @@ def watch_video(url):
     command = build_streaming_command(url)
     if format_code:  # Only add format if user specified one
         command.extend(["-f", format_code])
-    command.extend([
-        "-o", "-",  # Output to stdout for streaming
-        url
-    ])
+    command.extend(["-o", "-"])  # Output to stdout for streaming
+    # Reuse the metadata list_formats already fetched instead of having yt-dlp request it again
+    info_path = write_cached_info_json(url)
+    command.extend(["--load-info-json", info_path] if info_path else [url])
 
-    # VLC launch logic goes here...
-    vlc_command = ["vlc", "--no-video-title-show", "--avcodec-hw=none", "-"]
-    # We'll start yt-dlp and VLC together below (single controlled flow).
+    player_name, player_args = _pick_player()
+    player_command = [player_name, *player_args, "-"]
+    # We'll start yt-dlp and the player together below (single controlled flow).
     yt_process = None
-    vlc_process = None
+    yt_stderr = None
+    player_process = None
     
     # Signal handler for clean shutdown
     def signal_handler(signum, frame):
         print(f"\nReceived signal {signum}, cleaning up...")
         if yt_process and yt_process.poll() is None:
             yt_process.terminate()
-        if vlc_process and vlc_process.poll() is None:
-            vlc_process.terminate()
+        if player_process and player_process.poll() is None:
+            player_process.terminate()
         sys.exit(0)
     
     # Register signal handlers
@@ -772,32 +1054,31 @@ def watch_video(url):
     try:
         print(f"Streaming video with format '{format_code}' from: {url}")
         
-        # Check VLC compatibility
-        vlc_ok, vlc_message = check_vlc_compatibility()
-        if not vlc_ok:
-            print(f"VLC Error: {vlc_message}")
-            return
+        # Check VLC compatibility (mpv and ffplay were found on PATH by _pick_player)
+        if player_name == "vlc":
+            vlc_ok, vlc_message = check_vlc_compatibility()
+            if not vlc_ok:
+                print(f"VLC Error: {vlc_message}")
+                return
         
         print("Starting video stream... (Press Ctrl+C to stop)")
-        print("Note: VLC will open in a separate window")
+        print(f"Note: {player_name} will open in a separate window")
         
         # If this is a live stream and the user selected option 2 (direct URL), try to open that
         if live and choice == "1":
             direct = get_direct_stream_url(url)
             if direct:
-                print(f"Opening direct stream URL in VLC: {direct}")
-                vlc_process = subprocess.Popen([
-                    "vlc", "--no-video-title-show", "--avcodec-hw=none", direct
-                ])
-                vlc_process.wait()
+                print(f"Opening direct stream URL in {player_name}: {direct}")
+                player_process = subprocess.Popen([player_name, *player_args, direct])
+                player_process.wait()
                 return
             else:
                 print("Could not retrieve direct stream URL, falling back to piping via yt-dlp.")
         # If this is a live stream and user selected recording from start, launch yt-dlp with --live-from-start
         if live and choice == "2":
             record_dir = safe_input("Output directory for recording (or press Enter for default Videos): ").strip() or DEFAULT_VIDEO_DIR
-            os.makedirs(record_dir, exist_ok=True)
-            out_template = os.path.join(record_dir, "%(title)s.%(ext)s")
+            _ensure_dir(record_dir)
+            out_template = _out_template(record_dir)
             # Use build_base_command for consistency
             record_cmd = build_base_command(url)
             record_cmd.extend(["--live-from-start", "-o", out_template, url])
@@ -809,8 +1090,8 @@ def watch_video(url):
         # If user chose to start recording from now, run yt-dlp writing to file from the current point
         if live and choice == "3":
             record_dir = safe_input("Output directory for recording (or press Enter for default Videos): ").strip() or DEFAULT_VIDEO_DIR
-            os.makedirs(record_dir, exist_ok=True)
-            out_template = os.path.join(record_dir, "%(title)s.%(ext)s")
+            _ensure_dir(record_dir)
+            out_template = _out_template(record_dir)
             record_cmd = build_base_command(url)
             record_cmd.extend(["-o", out_template, url])
             print("Recording live stream from now (Ctrl+C to stop recording)...")
@@ -822,63 +1103,69 @@ def watch_video(url):
 
         # Start yt-dlp process (default streaming behavior)
         # Ensure yt-dlp runs in a safe directory so it doesn't write side files into the repo
-        os.makedirs(DEFAULT_VIDEO_DIR, exist_ok=True)
+        _ensure_dir(DEFAULT_VIDEO_DIR)
+        # yt-dlp's stderr goes to a temp file: nobody drains a pipe during playback, and a full
+        # stderr pipe would stall the stream. It's only read if yt-dlp fails to start.
+        import tempfile
+        yt_stderr = tempfile.TemporaryFile()
         yt_process = subprocess.Popen(
             command, 
             stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE,
+            stderr=yt_stderr,
             bufsize=0,  # Unbuffered
             cwd=DEFAULT_VIDEO_DIR,
         )
+        _enlarge_pipe(yt_process.stdout)
         
         # Give yt-dlp a moment to start
         time.sleep(1)
         
         # Check if yt-dlp started successfully
         if yt_process.poll() is not None:
-            stderr_output = yt_process.stderr.read().decode('utf-8', errors='ignore')
+            yt_stderr.seek(0)
+            stderr_output = yt_stderr.read().decode('utf-8', errors='ignore')
             print(f"yt-dlp failed to start: {stderr_output}")
             return
         
-        print("yt-dlp started, launching VLC...")
+        print(f"yt-dlp started, launching {player_name}...")
         
-        # Start VLC process
-        vlc_process = subprocess.Popen(
-            vlc_command, 
+        # Start player process
+        player_process = subprocess.Popen(
+            player_command, 
             stdin=yt_process.stdout, 
-            stdout=subprocess.DEVNULL,  # Suppress VLC output
-            stderr=subprocess.DEVNULL   # Suppress VLC errors
+            stdout=subprocess.DEVNULL,  # Suppress player output
+            stderr=subprocess.DEVNULL   # Suppress player errors
         )
         
         # Close our copy of the pipe
         yt_process.stdout.close()
         
-        print("VLC launched! The video should start playing shortly.")
+        print(f"{player_name} launched! The video should start playing shortly.")
         
-        # Wait for VLC to complete (with timeout protection)
+        # Wait for the player to complete (with timeout protection)
         try:
-            vlc_stdout, vlc_stderr = vlc_process.communicate(timeout=7200)  # 2 hour timeout
+            player_stdout, player_stderr = player_process.communicate(timeout=7200)  # 2 hour timeout
             
             # Check exit codes
-            if vlc_process.returncode == 0:
+            if player_process.returncode == 0:
                 print("Streaming completed successfully!")
-            elif vlc_process.returncode == 1:
-                print("Streaming ended (user closed VLC or stream ended)")
+            elif player_process.returncode == 1:
+                print(f"Streaming ended (user closed {player_name} or stream ended)")
             else:
-                print(f"VLC exited with code {vlc_process.returncode}")
-                if vlc_stderr:
-                    print(f"VLC error output: {vlc_stderr.decode('utf-8', errors='ignore')}")
+                print(f"{player_name} exited with code {player_process.returncode}")
+                if player_stderr:
+                    print(f"{player_name} error output: {player_stderr.decode('utf-8', errors='ignore')}")
                     
         except subprocess.TimeoutExpired:
             print("Stream timeout reached, stopping...")
-            vlc_process.terminate()
+            player_process.terminate()
             try:
-                vlc_process.wait(timeout=5)
+                player_process.wait(timeout=5)
             except subprocess.TimeoutExpired:
-                vlc_process.kill()
+                player_process.kill()
                 
     except FileNotFoundError:
-        print("Error: VLC media player not found. Please install VLC to use streaming feature.")
+        print("Error: No media player found. Please install mpv, ffplay or VLC to use streaming feature.")
     except subprocess.CalledProcessError as e:
         print(f"Error: Failed to start streaming.\n{e}")
     except KeyboardInterrupt:
@@ -894,14 +1181,21 @@ def watch_video(url):
                 yt_process.wait(timeout=5)
             except subprocess.TimeoutExpired:
                 yt_process.kill()
-        if vlc_process and vlc_process.poll() is None:
-            print("Cleaning up VLC process...")
-            vlc_process.terminate()
+        if player_process and player_process.poll() is None:
+            print(f"Cleaning up {player_name} process...")
+            player_process.terminate()
             try:
-                vlc_process.wait(timeout=5)
+                player_process.wait(timeout=5)
             except subprocess.TimeoutExpired:
-                vlc_process.kill()
-        # Exit the script after streaming to prevent re-opening VLC
+                player_process.kill()
+        if yt_stderr:
+            yt_stderr.close()
+        if info_path:
+            try:
+                os.remove(info_path)
+            except OSError:
+                pass
+        # Exit the script after streaming to prevent re-opening the player
         sys.exit(0)
 
 def download_video(url, output_dir=None):
@@ -909,14 +1203,15 @@ def download_video(url, output_dir=None):
     if output_dir is None:
         output_dir = DEFAULT_VIDEO_DIR
     
-    os.makedirs(output_dir, exist_ok=True)
+    _ensure_dir(output_dir)
     video_title = safe_input("Video title (or press Enter for auto-generated): ").strip()
     
     # Use auto-generated title if none provided
-    output_template = os.path.join(output_dir, f"{video_title}.%(ext)s") if video_title else os.path.join(output_dir, "%(title)s.%(ext)s")
+    output_template = _out_template(output_dir, video_title)
     
     command = build_base_command(url)
     command.extend([
+        *FRAGMENT_DOWNLOAD_ARGS,
         "--yes-playlist" if is_playlist(url) else "--no-playlist",
         "-o", output_template,
         url,
@@ -946,8 +1241,8 @@ def record_live(url, output_dir=None, from_start=False):
     """Record a live stream to disk. If from_start is True, use --live-from-start to try and capture from the very beginning."""
     if output_dir is None:
         output_dir = DEFAULT_VIDEO_DIR
-    os.makedirs(output_dir, exist_ok=True)
-    out_template = os.path.join(output_dir, "%(title)s.%(ext)s")
+    _ensure_dir(output_dir)
+    out_template = _out_template(output_dir)
 
     cmd = build_base_command(url)
     if from_start:
@@ -973,14 +1268,11 @@ def analyze_live_stream_availability(url):
     
     try:
         # Get stream info without downloading
-        command = ["yt-dlp", "--dump-json", "--no-download", url]
-        result = subprocess.run(command, capture_output=True, text=True, timeout=15)
+        data = fetch_video_info(url)
         
-        if result.returncode != 0:
+        if not data:
             print("Could not analyse stream")
             return None
-            
-        data = json.loads(result.stdout)
         
         # Check for fragments (indicates segmented live stream)
         has_fragments = False
@@ -1025,7 +1317,7 @@ def download_live_from_start(url, output_dir=None):
     if output_dir is None:
         output_dir = DEFAULT_VIDEO_DIR
     
-    os.makedirs(output_dir, exist_ok=True)
+    _ensure_dir(output_dir)
     
     print("Live Stream Download from Beginning")
     print("This will attempt to download the stream from its beginning using --live-from-start.")
@@ -1034,7 +1326,8 @@ def download_live_from_start(url, output_dir=None):
     analysis = analyze_live_stream_availability(url)
     
     # Check if this is a Facebook live stream
-    parsed_url = urllib.parse.urlparse(url)
+    from urllib.parse import urlparse
+    parsed_url = urlparse(url)
     is_facebook = "facebook.com" in parsed_url.netloc.lower()
     
     # Provide warnings based on analysis
@@ -1068,10 +1361,7 @@ def download_live_from_start(url, output_dir=None):
     video_title = safe_input("Video title (or press Enter for auto-generated): ").strip()
     
     # Use custom title if provided, otherwise use default template
-    if video_title:
-        output_template = os.path.join(output_dir, f"{sanitize_filename(video_title)}.%(ext)s")
-    else:
-        output_template = os.path.join(output_dir, "%(title)s.%(ext)s")
+    output_template = _out_template(output_dir, sanitize_filename(video_title) if video_title else None)
     
     command = build_base_command(url)
     command.extend([
@@ -1141,6 +1431,71 @@ def download_live_from_start(url, output_dir=None):
                 download_video(url, output_dir)
                 return
 
+# Number of playlist entries downloaded and converted at the same time
+PLAYLIST_DOWNLOAD_JOBS = 4
+
+def _enumerate_playlist(url):
+    """Return the entry URLs of a playlist in order, or an empty list if it can't be listed."""
+    command = add_browser_cookies(["yt-dlp", "--no-config", "--flat-playlist",
+                                   "--print", "%(webpage_url,url)s", url], url)
+    try:
+        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                text=True, timeout=120)
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return []
+    if result.returncode != 0:
+        return []
+    return [line.strip() for line in result.stdout.splitlines() if line.strip() and line.strip() != "NA"]
+
+def _download_playlist_audio_parallel(entries, output_dir, jobs=PLAYLIST_DOWNLOAD_JOBS):
+    """Download playlist entries as numbered MP3s with several yt-dlp processes at once.
+    
+    Returns the number of entries that failed.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    
+    def download_one(index, entry_url):
+        command = build_audio_command(entry_url)
+        command.extend([
+            "--no-playlist",
+            "--quiet", "--no-warnings",
+            "-o", os.path.join(output_dir, f"{index:02d} - %(title)s.%(ext)s"),
+            entry_url,
+        ])
+        result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                text=True, cwd=output_dir)
+        return result.returncode, result.stderr.strip(), "--cookies-from-browser" in command
+    
+    failed = 0
+    done = 0
+    cookies_failed = False
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = {executor.submit(download_one, index, entry_url): (index, entry_url)
+                   for index, entry_url in enumerate(entries, start=1)}
+        try:
+            for future in as_completed(futures):
+                index, entry_url = futures[future]
+                returncode, errors, used_cookies = future.result()
+                done += 1
+                if returncode == 0:
+                    print(f"✓ [{done}/{len(entries)}] Track {index:02d} done")
+                else:
+                    failed += 1
+                    cookies_failed = cookies_failed or used_cookies
+                    last_error = errors.splitlines()[-1] if errors else f"return code {returncode}"
+                    print(f"✗ [{done}/{len(entries)}] Track {index:02d} failed ({entry_url}): {last_error}")
+        except KeyboardInterrupt:
+            # Running yt-dlp processes get the same Ctrl+C; just don't start any more
+            for future in futures:
+                future.cancel()
+            print("\nDownload interrupted by user.")
+            raise
+        finally:
+            # A failed track that used saved browser cookies may mean that choice went stale
+            if cookies_failed:
+                _forget_cookie_cache()
+    return failed
+
 def download_audio(url, output_dir=None):
     """Download best audio only using config file defaults."""
     if output_dir is None:
@@ -1165,19 +1520,36 @@ def download_audio(url, output_dir=None):
     folder_name = sanitize_filename(folder_name)
     
     output_dir = os.path.join(base_output_dir, folder_name)
-    os.makedirs(output_dir, exist_ok=True)
+    _ensure_dir(output_dir)
     
-    if is_playlist(url):
+    playlist = is_playlist(url)
+    if playlist:
         print(f"Downloading playlist to folder '{folder_name}'")
         # For playlists, add track numbers
         output_template = os.path.join(output_dir, "%(playlist_index)02d - %(title)s.%(ext)s")
     else:
         print(f"Downloading single track to folder '{folder_name}'")
-        output_template = os.path.join(output_dir, "%(title)s.%(ext)s")
+        output_template = _out_template(output_dir)
+    
+    # Playlists: fetch and convert several tracks at once instead of one after another
+    entries = _enumerate_playlist(url) if playlist and PLAYLIST_DOWNLOAD_JOBS > 1 else []
+    if len(entries) > 1:
+        jobs = min(PLAYLIST_DOWNLOAD_JOBS, len(entries))
+        print(f"Downloading {len(entries)} tracks, {jobs} at a time, from: {url}")
+        print(f"Output directory: {output_dir}")
+        failed = _download_playlist_audio_parallel(entries, output_dir, jobs)
+        if failed:
+            print(f"Error: {failed} of {len(entries)} tracks failed to download")
+        else:
+            print("✓ Audio download complete!")
+        print(f"Files saved in: {output_dir}")
+        print(f"To open folder: nautilus '{output_dir}' &")
+        print("Note: Audio files converted to MP3 format.")
+        return
     
     command = build_audio_command(url)
     command.extend([
-        "--yes-playlist" if is_playlist(url) else "--no-playlist",
+        "--yes-playlist" if playlist else "--no-playlist",
         "-o", output_template,
         url,
     ])
@@ -1206,17 +1578,15 @@ def download_video_no_audio(url, output_dir=None):
     if output_dir is None:
         output_dir = DEFAULT_VIDEO_DIR
     
-    os.makedirs(output_dir, exist_ok=True)
+    _ensure_dir(output_dir)
     title = safe_input("Video title (or press Enter for auto-generated): ").strip()
     
-    if title:
-        output_template = os.path.join(output_dir, f"{title}_video_only.%(ext)s")
-    else:
-        output_template = os.path.join(output_dir, "%(title)s_video_only.%(ext)s")
+    output_template = _out_template(output_dir, title, suffix="_video_only")
     
     command = build_base_command(url)
     command.extend([
         "-f", "bestvideo",  # Override config for video-only
+        *FRAGMENT_DOWNLOAD_ARGS,
         "--yes-playlist" if is_playlist(url) else "--no-playlist",
         "-o", output_template,
         url,
@@ -1239,11 +1609,12 @@ def download_video_no_audio(url, output_dir=None):
 def download_audio_from_video(url, output_dir):
     """Download audio only from a video or playlist."""
     sanitized_dir = sanitize_path(output_dir)
-    os.makedirs(sanitized_dir, exist_ok=True)
-    output_template = os.path.join(sanitized_dir, "%(title)s.%(ext)s")
+    _ensure_dir(sanitized_dir)
+    output_template = _out_template(sanitized_dir)
 
     command = build_audio_command(url)
     command.extend([
+        *FRAGMENT_DOWNLOAD_ARGS,
         "--yes-playlist" if is_playlist(url) else "--no-playlist",
         "-o", output_template,
         url,
@@ -1279,9 +1650,8 @@ def safe_input(prompt):
 
 def check_dependencies():
     """Check if required dependencies are installed."""
-    try:
-        subprocess.run(["yt-dlp", "--version"], capture_output=True, check=True)
-    except FileNotFoundError:
+    # A PATH lookup is enough here; no need to start yt-dlp on every launch
+    if not _cap("yt-dlp"):
         print("Error: yt-dlp is not installed or not in PATH.")
         return False
     return True
@@ -1385,6 +1755,14 @@ def show_recent_downloads():
             print(f"{dir_type} directory: {dir_path} (not created yet)")
         print()
 
+# Config options show_config highlights, as (option prefix, label)
+CONFIG_KEY_SETTINGS = (
+    ('--format', 'Quality'),
+    ('--audio-format', 'Audio'),
+    ('--sponsorblock', 'SponsorBlock'),
+    ('--embed-chapters', 'Chapters'),
+)
+
 def show_config():
     """Display current configuration information."""
     print("=== YouTube Downloader Configuration ===\n")
@@ -1402,22 +1780,15 @@ def show_config():
         # Show some key settings from config
         try:
             with open(config_file, 'r') as f:
-                content = f.read()
                 print("\nKey settings from config file:")
                 
-                # Extract some important settings
-                lines = content.split('\n')
-                for line in lines:
+                # Extract some important settings (options start their line)
+                for line in f:
                     line = line.strip()
-                    if line and not line.startswith('#'):
-                        if '--format' in line:
-                            print(f"  Quality: {line}")
-                        elif '--audio-format' in line:
-                            print(f"  Audio: {line}")
-                        elif '--sponsorblock' in line:
-                            print(f"  SponsorBlock: {line}")
-                        elif '--embed-chapters' in line:
-                            print(f"  Chapters: {line}")
+                    for prefix, label in CONFIG_KEY_SETTINGS:
+                        if line.startswith(prefix):
+                            print(f"  {label}: {line}")
+                            break
         except Exception as e:
             print(f"Could not read config: {e}")
     else:
@@ -1430,98 +1801,176 @@ def show_config():
     
     # Check dependencies
     print(f"\nDependency status:")
-    try:
-        result = subprocess.run(["yt-dlp", "--version"], capture_output=True, text=True, check=True)
-        print(f"  yt-dlp: {result.stdout.strip()}")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    ytdlp_version = _tool_version("yt-dlp")
+    if ytdlp_version is not None:
+        print(f"  yt-dlp: {ytdlp_version}")
+    else:
         print(f"  yt-dlp: Not found or not working")
     
-    try:
-        subprocess.run(["vlc", "--version"], capture_output=True, check=True)
+    if _tool_version("vlc") is not None:
         print(f"  VLC: Available (streaming works)")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    else:
         print(f"  VLC: Not found (streaming unavailable)")
     
-    try:
-        subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
+    if _tool_version("ffmpeg", "-version") is not None:
         print(f"  ffmpeg: Available (video editing works)")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    else:
         print(f"  ffmpeg: Not found (video editing unavailable)")
 
 # === VIDEO EDITING FUNCTIONS ===
 
+def _cap(name):
+    """Return whether the named tool is on PATH, probing it only once per process."""
+    if name not in _CAPS:
+        _CAPS[name] = shutil.which(name) is not None
+    return _CAPS[name]
+
+def _tool_version(name, flag="--version"):
+    """Return the first line of the tool's version output, or None if it is missing or fails.
+    
+    Each tool is only run once per process.
+    """
+    if name not in _TOOL_VERSIONS:
+        version = None
+        try:
+            result = subprocess.run([name, flag], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                    text=True, timeout=5)
+            if result.returncode == 0:
+                version = next(iter(result.stdout.splitlines()), "").strip()
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            pass
+        _TOOL_VERSIONS[name] = version
+    return _TOOL_VERSIONS[name]
+
+def _ffmpeg_supports(list_option, feature):
+    """Return whether feature appears in ffmpeg's list_option output (e.g. -hwaccels), probing once."""
+    key = f"ffmpeg {list_option}: {feature}"
+    if key not in _CAPS:
+        try:
+            result = subprocess.run(["ffmpeg", "-hide_banner", list_option],
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+            _CAPS[key] = result.returncode == 0 and feature in result.stdout
+        except FileNotFoundError:
+            _CAPS[key] = False
+    return _CAPS[key]
+
 def check_ffmpeg():
     """Check if ffmpeg is available."""
-    try:
-        subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True, timeout=5)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        return False
+    return _tool_version("ffmpeg", "-version") is not None
+
+def get_nvenc_split_encode_args(width, height):
+    """Return Split-Frame Encoding args for UHD NVENC encodes, or [] if not applicable.
+
+    SFE spreads a single frame across the multiple NVENC engines on Ada/Blackwell GPUs,
+    roughly doubling encode throughput at 4K/8K. Older ffmpeg builds don't know the option.
+    """
+    global _nvenc_split_encode_value, _nvenc_split_encode_checked
+    
+    if max(width, height) < 3840:
+        return []
+    
+    if not _nvenc_split_encode_checked:
+        _nvenc_split_encode_checked = True
+        try:
+            result = subprocess.run(["ffmpeg", "-hide_banner", "-h", "encoder=h264_nvenc"],
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=5)
+            help_text = result.stdout if result.returncode == 0 else ""
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            help_text = ""
+        if "split_encode_mode" in help_text:
+            # Prefer forcing SFE on; builds that only expose the named modes get "auto"
+            _nvenc_split_encode_value = "1" if "forced" in help_text else "auto"
+    
+    if _nvenc_split_encode_value is None:
+        return []
+    return ["-split_encode_mode", _nvenc_split_encode_value]
+
+@functools.lru_cache(maxsize=64)
+def _probe_video_info(filepath, mtime_ns, size):
+    """Run ffprobe for get_video_info; cached per file contents, failures propagate uncached."""
+    # Get duration
+    duration_result = subprocess.run([
+        "ffprobe", "-v", "quiet", "-show_entries", "format=duration",
+        "-of", "csv=p=0", filepath
+    ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=10)
+    
+    duration = ""
+    duration_sec = 0.0
+    if duration_result.returncode == 0 and duration_result.stdout.strip():
+        duration_sec = float(duration_result.stdout.strip())
+        hours = int(duration_sec // 3600)
+        minutes = int((duration_sec % 3600) // 60)
+        seconds = int(duration_sec % 60)
+        duration = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    
+    # Get resolution
+    resolution_result = subprocess.run([
+        "ffprobe", "-v", "quiet", "-select_streams", "v:0",
+        "-show_entries", "stream=width,height", "-of", "csv=p=0", filepath
+    ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=10)
+    
+    resolution = ""
+    width = height_int = 0
+    if resolution_result.returncode == 0 and resolution_result.stdout.strip():
+        width, height = resolution_result.stdout.strip().split(',')
+        resolution = f"{width}x{height}"
+        width = int(width)
+        
+        # Add quality label
+        height_int = int(height)
+        if height_int >= 2160:
+            quality = "4K (2160p)"
+        elif height_int >= 1440:
+            quality = "1440p (2K)"
+        elif height_int >= 1080:
+            quality = "1080p (Full HD)"
+        elif height_int >= 720:
+            quality = "720p (HD)"
+        elif height_int >= 480:
+            quality = "480p (SD)"
+        else:
+            quality = f"{height_int}p"
+        
+        resolution = f"{resolution} ({quality})"
+    
+    # Format the file size already taken from the cache key's stat
+    if size >= 1024**3:
+        file_size = f"{size / (1024**3):.1f} GB"
+    elif size >= 1024**2:
+        file_size = f"{size / (1024**2):.1f} MB"
+    else:
+        file_size = f"{size / 1024:.1f} KB"
+    
+    return {
+        'duration': duration,
+        'duration_seconds': duration_sec,
+        'resolution': resolution,
+        'file_size': file_size,
+        'width': width,
+        'height': height_int
+    }
 
 def get_video_info(filepath):
     """Get video information using ffprobe."""
     try:
-        # Get duration
-        duration_result = subprocess.run([
-            "ffprobe", "-v", "quiet", "-show_entries", "format=duration",
-            "-of", "csv=p=0", filepath
-        ], capture_output=True, text=True, timeout=10)
-        
-        duration = ""
-        if duration_result.returncode == 0 and duration_result.stdout.strip():
-            duration_sec = float(duration_result.stdout.strip())
-            hours = int(duration_sec // 3600)
-            minutes = int((duration_sec % 3600) // 60)
-            seconds = int(duration_sec % 60)
-            duration = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        
-        # Get resolution
-        resolution_result = subprocess.run([
-            "ffprobe", "-v", "quiet", "-select_streams", "v:0",
-            "-show_entries", "stream=width,height", "-of", "csv=p=0", filepath
-        ], capture_output=True, text=True, timeout=10)
-        
-        resolution = ""
-        if resolution_result.returncode == 0 and resolution_result.stdout.strip():
-            width, height = resolution_result.stdout.strip().split(',')
-            resolution = f"{width}x{height}"
-            
-            # Add quality label
-            height_int = int(height)
-            if height_int >= 2160:
-                quality = "4K (2160p)"
-            elif height_int >= 1440:
-                quality = "1440p (2K)"
-            elif height_int >= 1080:
-                quality = "1080p (Full HD)"
-            elif height_int >= 720:
-                quality = "720p (HD)"
-            elif height_int >= 480:
-                quality = "480p (SD)"
-            else:
-                quality = f"{height_int}p"
-            
-            resolution = f"{resolution} ({quality})"
-        
-        # Get file size
-        file_size = ""
-        if os.path.exists(filepath):
-            size_bytes = os.path.getsize(filepath)
-            if size_bytes >= 1024**3:
-                file_size = f"{size_bytes / (1024**3):.1f} GB"
-            elif size_bytes >= 1024**2:
-                file_size = f"{size_bytes / (1024**2):.1f} MB"
-            else:
-                file_size = f"{size_bytes / 1024:.1f} KB"
-        
-        return {
-            'duration': duration,
-            'resolution': resolution,
-            'file_size': file_size
-        }
+        # Keyed on mtime and size so re-encoding the file in place invalidates the entry
+        stat = os.stat(filepath)
+        return dict(_probe_video_info(os.path.realpath(filepath), stat.st_mtime_ns, stat.st_size))
     except Exception as e:
         print(f"Warning: Could not get video info: {e}")
-        return {'duration': 'Unknown', 'resolution': 'Unknown', 'file_size': 'Unknown'}
+        return {'duration': 'Unknown', 'duration_seconds': 0.0, 'resolution': 'Unknown',
+                'file_size': 'Unknown', 'width': 0, 'height': 0}
+
+def get_video_codec(filepath):
+    """Return the codec name of the first video stream (e.g. 'h264'), or '' if unknown."""
+    try:
+        result = subprocess.run([
+            "ffprobe", "-v", "quiet", "-select_streams", "v:0",
+            "-show_entries", "stream=codec_name", "-of", "csv=p=0", filepath
+        ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=10)
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return ""
+    return result.stdout.strip() if result.returncode == 0 else ""
 
 def validate_output_path(output_path):
     """Validate and suggest output filename if file exists."""
@@ -1550,9 +1999,27 @@ def validate_output_path(output_path):
     
     return output_path
 
+def is_output_up_to_date(input_file, output_path):
+    """Return True if output_path exists, is non-empty, and is newer than input_file.
+
+    Only meaningful for deterministic stream-copy operations, where re-running with the
+    same input would produce the same file. Callers should only ask about the operation's
+    own default output name, so an unrelated file with a user-chosen name still goes
+    through the usual overwrite/rename prompt.
+    """
+    try:
+        if os.path.samefile(input_file, output_path):
+            return False
+        out_stat = os.stat(output_path)
+        return out_stat.st_size > 0 and out_stat.st_mtime >= os.path.getmtime(input_file)
+    except OSError:
+        return False
+
 def trim_video(input_file):
     """Trim video keeping original quality."""
-    print(f"\n=== Trim Video: {os.path.basename(input_file)} ===")
+    in_dir, in_name = os.path.split(input_file)
+    in_base, in_ext = os.path.splitext(in_name)
+    print(f"\n=== Trim Video: {in_name} ===")
     
     # Show video info
     info = get_video_info(input_file)
@@ -1573,15 +2040,14 @@ def trim_video(input_file):
     
     output_filename = safe_input("Enter output filename (with extension): ").strip()
     if not output_filename:
-        base_name = os.path.splitext(os.path.basename(input_file))[0]
-        output_filename = f"{base_name}_trimmed.mp4"
+        output_filename = f"{in_base}_trimmed.mp4"
         print(f"Using default filename: {output_filename}")
     
-    output_path = os.path.join(os.path.dirname(input_file), output_filename)
+    output_path = os.path.join(in_dir, output_filename)
     output_path = validate_output_path(output_path)
     
     print(f"\n=== Trim Summary ===")
-    print(f"Input: {os.path.basename(input_file)}")
+    print(f"Input: {in_name}")
     print(f"Start time: {start_time}")
     print(f"End time: {end_time}")
     print(f"Output: {os.path.basename(output_path)}")
@@ -1594,8 +2060,7 @@ def trim_video(input_file):
     print("Trimming video...")
     try:
         # Check for CUDA support
-        cuda_check = subprocess.run(["ffmpeg", "-hwaccels"], capture_output=True, text=True)
-        use_cuda = "cuda" in cuda_check.stdout if cuda_check.returncode == 0 else False
+        use_cuda = _ffmpeg_supports("-hwaccels", "cuda")
         
         if use_cuda:
             cmd = ["ffmpeg", "-hwaccel", "cuda", "-ss", start_time, "-i", input_file, 
@@ -1604,7 +2069,7 @@ def trim_video(input_file):
             cmd = ["ffmpeg", "-ss", start_time, "-i", input_file, 
                    "-to", end_time, "-c", "copy", output_path]
         
-        result = subprocess.run(cmd, check=True, cwd=os.path.dirname(input_file))
+        result = subprocess.run(cmd, check=True)
         print(f"✓ Trimming completed successfully!")
         print(f"Output saved: {output_path}")
         
@@ -1613,7 +2078,9 @@ def trim_video(input_file):
 
 def transcode_video(input_file):
     """Transcode video to change quality/bitrate."""
-    print(f"\n=== Transcode Video: {os.path.basename(input_file)} ===")
+    in_dir, in_name = os.path.split(input_file)
+    in_base, in_ext = os.path.splitext(in_name)
+    print(f"\n=== Transcode Video: {in_name} ===")
     
     info = get_video_info(input_file)
     print(f"Duration: {info['duration']}")
@@ -1635,15 +2102,14 @@ def transcode_video(input_file):
     
     output_filename = safe_input("Enter output filename (with extension): ").strip()
     if not output_filename:
-        base_name = os.path.splitext(os.path.basename(input_file))[0]
-        output_filename = f"{base_name}_transcoded.mp4"
+        output_filename = f"{in_base}_transcoded.mp4"
         print(f"Using default filename: {output_filename}")
     
-    output_path = os.path.join(os.path.dirname(input_file), output_filename)
+    output_path = os.path.join(in_dir, output_filename)
     output_path = validate_output_path(output_path)
     
     print(f"\n=== Transcode Summary ===")
-    print(f"Input: {os.path.basename(input_file)}")
+    print(f"Input: {in_name}")
     print(f"Target bitrate: {bitrate} kbps")
     print(f"Output: {os.path.basename(output_path)}")
     
@@ -1655,13 +2121,15 @@ def transcode_video(input_file):
     print("Transcoding video...")
     try:
         # Check for NVIDIA GPU support
-        encoders_check = subprocess.run(["ffmpeg", "-encoders"], capture_output=True, text=True)
-        use_nvenc = "h264_nvenc" in encoders_check.stdout if encoders_check.returncode == 0 else False
+        use_nvenc = _ffmpeg_supports("-encoders", "h264_nvenc")
         
         if use_nvenc:
             print("Using NVIDIA GPU acceleration (h264_nvenc)")
+            sfe_args = get_nvenc_split_encode_args(info['width'], info['height'])
+            if sfe_args:
+                print("UHD input detected - enabling split-frame encoding")
             cmd = ["ffmpeg", "-hwaccel", "cuda", "-hwaccel_output_format", "cuda", 
-                   "-i", input_file, "-c:v", "h264_nvenc", "-b:v", f"{bitrate}k",
+                   "-i", input_file, "-c:v", "h264_nvenc", *sfe_args, "-b:v", f"{bitrate}k",
                    "-minrate", f"{bitrate}k", "-maxrate", f"{bitrate}k", 
                    "-bufsize", f"{bitrate * 2}k", "-c:a", "aac", output_path]
         else:
@@ -1670,7 +2138,7 @@ def transcode_video(input_file):
                    "-minrate", f"{bitrate}k", "-maxrate", f"{bitrate}k", 
                    "-bufsize", f"{bitrate * 2}k", "-c:a", "aac", output_path]
         
-        result = subprocess.run(cmd, check=True, cwd=os.path.dirname(input_file))
+        result = subprocess.run(cmd, check=True)
         print(f"✓ Transcoding completed successfully!")
         print(f"Output saved: {output_path}")
         
@@ -1679,7 +2147,9 @@ def transcode_video(input_file):
 
 def convert_format(input_file):
     """Convert video format without re-encoding."""
-    print(f"\n=== Convert Format: {os.path.basename(input_file)} ===")
+    in_dir, in_name = os.path.split(input_file)
+    in_base, in_ext = os.path.splitext(in_name)
+    print(f"\n=== Convert Format: {in_name} ===")
     
     info = get_video_info(input_file)
     print(f"Duration: {info['duration']}")
@@ -1688,16 +2158,20 @@ def convert_format(input_file):
     print()
     
     output_filename = safe_input("Enter output filename (with extension): ").strip()
-    if not output_filename:
-        base_name = os.path.splitext(os.path.basename(input_file))[0]
-        output_filename = f"{base_name}_converted.mp4"
+    default_name = not output_filename
+    if default_name:
+        output_filename = f"{in_base}_converted.mp4"
         print(f"Using default filename: {output_filename}")
     
-    output_path = os.path.join(os.path.dirname(input_file), output_filename)
+    output_path = os.path.join(in_dir, output_filename)
+    # Only a previous run's default output can be assumed to be this operation's result
+    if default_name and is_output_up_to_date(input_file, output_path):
+        print(f"✓ {os.path.basename(output_path)} is already up-to-date. Skipping.")
+        return
     output_path = validate_output_path(output_path)
     
     print(f"\n=== Format Conversion Summary ===")
-    print(f"Input: {os.path.basename(input_file)}")
+    print(f"Input: {in_name}")
     print(f"Output: {os.path.basename(output_path)}")
     print("Note: This will copy streams without re-encoding (fast, no quality loss)")
     
@@ -1709,7 +2183,7 @@ def convert_format(input_file):
     print("Converting format...")
     try:
         cmd = ["ffmpeg", "-i", input_file, "-c", "copy", output_path]
-        result = subprocess.run(cmd, check=True, cwd=os.path.dirname(input_file))
+        result = subprocess.run(cmd, check=True)
         print(f"✓ Format conversion completed successfully!")
         print(f"Output saved: {output_path}")
         
@@ -1718,7 +2192,9 @@ def convert_format(input_file):
 
 def convert_to_gif(input_file):
     """Convert video to GIF."""
-    print(f"\n=== Convert to GIF: {os.path.basename(input_file)} ===")
+    in_dir, in_name = os.path.split(input_file)
+    in_base, in_ext = os.path.splitext(in_name)
+    print(f"\n=== Convert to GIF: {in_name} ===")
     
     info = get_video_info(input_file)
     print(f"Duration: {info['duration']}")
@@ -1774,16 +2250,15 @@ def convert_to_gif(input_file):
     
     output_filename = safe_input("Enter output filename (with .gif extension): ").strip()
     if not output_filename:
-        base_name = os.path.splitext(os.path.basename(input_file))[0]
-        output_filename = f"{base_name}.gif"
+        output_filename = f"{in_base}.gif"
     elif not output_filename.endswith('.gif'):
         output_filename += '.gif'
     
-    output_path = os.path.join(os.path.dirname(input_file), output_filename)
+    output_path = os.path.join(in_dir, output_filename)
     output_path = validate_output_path(output_path)
     
     print(f"\n=== GIF Conversion Summary ===")
-    print(f"Input: {os.path.basename(input_file)}")
+    print(f"Input: {in_name}")
     if start_time:
         print(f"Start time: {start_time}")
         print(f"Duration: {duration_seconds} seconds")
@@ -1801,7 +2276,7 @@ def convert_to_gif(input_file):
     print("Converting to GIF...")
     try:
         # Create temporary palette file
-        temp_palette = os.path.join(os.path.dirname(input_file), "temp_palette.png")
+        temp_palette = os.path.join(in_dir, "temp_palette.png")
         
         # Build palette generation command
         palette_cmd = ["ffmpeg", "-y"]
@@ -1813,7 +2288,7 @@ def convert_to_gif(input_file):
         palette_cmd.extend(["-vf", f"fps={gif_fps},{scale_filter}:flags=lanczos,palettegen=stats_mode=diff", temp_palette])
         
         # Generate palette
-        subprocess.run(palette_cmd, check=True, cwd=os.path.dirname(input_file))
+        subprocess.run(palette_cmd, check=True)
         
         # Build GIF generation command
         gif_cmd = ["ffmpeg", "-y"]
@@ -1825,7 +2300,7 @@ def convert_to_gif(input_file):
         gif_cmd.extend(["-lavfi", f"fps={gif_fps},{scale_filter}:flags=lanczos[x];[x][1:v]paletteuse=dither=bayer:bayer_scale=5:diff_mode=rectangle", output_path])
         
         # Generate GIF
-        subprocess.run(gif_cmd, check=True, cwd=os.path.dirname(input_file))
+        subprocess.run(gif_cmd, check=True)
         
         # Clean up temporary palette
         if os.path.exists(temp_palette):
@@ -1836,14 +2311,16 @@ def convert_to_gif(input_file):
         
     except subprocess.CalledProcessError as e:
         # Clean up temporary palette on error
-        temp_palette = os.path.join(os.path.dirname(input_file), "temp_palette.png")
+        temp_palette = os.path.join(in_dir, "temp_palette.png")
         if os.path.exists(temp_palette):
             os.remove(temp_palette)
         print(f"✗ Error during GIF conversion: {e}")
 
 def add_padding(input_file):
     """Add black bars for Instagram formats."""
-    print(f"\n=== Add Padding: {os.path.basename(input_file)} ===")
+    in_dir, in_name = os.path.split(input_file)
+    in_base, in_ext = os.path.splitext(in_name)
+    print(f"\n=== Add Padding: {in_name} ===")
     
     info = get_video_info(input_file)
     print(f"Duration: {info['duration']}")
@@ -1885,18 +2362,17 @@ def add_padding(input_file):
     
     output_filename = safe_input("Enter output filename (with extension): ").strip()
     if not output_filename:
-        base_name = os.path.splitext(os.path.basename(input_file))[0]
         if out_type == "2":
-            output_filename = f"{base_name}_padded.gif"
+            output_filename = f"{in_base}_padded.gif"
         else:
-            output_filename = f"{base_name}_padded.mp4"
+            output_filename = f"{in_base}_padded.mp4"
         print(f"Using default filename: {output_filename}")
     
-    output_path = os.path.join(os.path.dirname(input_file), output_filename)
+    output_path = os.path.join(in_dir, output_filename)
     output_path = validate_output_path(output_path)
     
     print(f"\n=== Padding Summary ===")
-    print(f"Input: {os.path.basename(input_file)}")
+    print(f"Input: {in_name}")
     print(f"Output resolution: {out_w}x{out_h}")
     print(f"Output: {os.path.basename(output_path)}")
     
@@ -1917,7 +2393,7 @@ def add_padding(input_file):
             else:
                 cmd = ["ffmpeg", "-i", input_file, "-vf", vf, "-c:a", "copy", output_path]
             
-            subprocess.run(cmd, check=True, cwd=os.path.dirname(input_file))
+            subprocess.run(cmd, check=True)
             
         else:  # GIF
             print("GIF frame rate (fps) - lower = smaller file size:")
@@ -1935,21 +2411,21 @@ def add_padding(input_file):
             # Ensure .gif extension
             if not output_filename.endswith('.gif'):
                 output_filename += '.gif'
-                output_path = os.path.join(os.path.dirname(input_file), output_filename)
+                output_path = os.path.join(in_dir, output_filename)
             
             print(f"Converting padded GIF at {gif_fps} fps...")
             
             # Generate palette for padded frames
-            temp_palette = os.path.join(os.path.dirname(input_file), "temp_palette_pad.png")
+            temp_palette = os.path.join(in_dir, "temp_palette_pad.png")
             palette_cmd = ["ffmpeg", "-y", "-i", input_file, "-vf", 
                           f"{vf},fps={gif_fps},palettegen=stats_mode=diff", temp_palette]
-            subprocess.run(palette_cmd, check=True, cwd=os.path.dirname(input_file))
+            subprocess.run(palette_cmd, check=True)
             
             # Create GIF using palette
             gif_cmd = ["ffmpeg", "-y", "-i", input_file, "-i", temp_palette, "-lavfi",
                       f"{vf},fps={gif_fps}[x];[x][1:v]paletteuse=dither=bayer:bayer_scale=5:diff_mode=rectangle", 
                       output_path]
-            subprocess.run(gif_cmd, check=True, cwd=os.path.dirname(input_file))
+            subprocess.run(gif_cmd, check=True)
             
             # Clean up
             if os.path.exists(temp_palette):
@@ -1960,14 +2436,16 @@ def add_padding(input_file):
         
     except subprocess.CalledProcessError as e:
         # Clean up on error
-        temp_palette = os.path.join(os.path.dirname(input_file), "temp_palette_pad.png")
+        temp_palette = os.path.join(in_dir, "temp_palette_pad.png")
         if os.path.exists(temp_palette):
             os.remove(temp_palette)
         print(f"✗ Error during padding: {e}")
 
 def extract_audio(input_file):
     """Extract audio as MP3."""
-    print(f"\n=== Extract Audio: {os.path.basename(input_file)} ===")
+    in_dir, in_name = os.path.split(input_file)
+    in_base, in_ext = os.path.splitext(in_name)
+    print(f"\n=== Extract Audio: {in_name} ===")
     
     info = get_video_info(input_file)
     print(f"Duration: {info['duration']}")
@@ -2004,15 +2482,14 @@ def extract_audio(input_file):
     
     output_filename = safe_input("Enter output filename (without extension): ").strip()
     if not output_filename:
-        base_name = os.path.splitext(os.path.basename(input_file))[0]
-        output_filename = f"{base_name}_audio"
+        output_filename = f"{in_base}_audio"
         print(f"Using default filename: {output_filename}")
     
-    output_path = os.path.join(os.path.dirname(input_file), output_filename + ".mp3")
+    output_path = os.path.join(in_dir, output_filename + ".mp3")
     output_path = validate_output_path(output_path)
     
     print(f"\n=== Audio Extraction Summary ===")
-    print(f"Input: {os.path.basename(input_file)}")
+    print(f"Input: {in_name}")
     print(f"Quality: {bitrate}")
     print(f"Output: {os.path.basename(output_path)}")
     
@@ -2024,7 +2501,7 @@ def extract_audio(input_file):
     print("Extracting audio...")
     try:
         cmd = ["ffmpeg", "-i", input_file, "-vn", "-acodec", "libmp3lame", "-ab", bitrate, output_path]
-        subprocess.run(cmd, check=True, cwd=os.path.dirname(input_file))
+        subprocess.run(cmd, check=True)
         print(f"✓ Audio extraction completed successfully!")
         print(f"Output saved: {output_path}")
         
@@ -2033,7 +2510,9 @@ def extract_audio(input_file):
 
 def remove_audio(input_file):
     """Remove audio completely from video."""
-    print(f"\n=== Remove Audio: {os.path.basename(input_file)} ===")
+    in_dir, in_name = os.path.split(input_file)
+    in_base, in_ext = os.path.splitext(in_name)
+    print(f"\n=== Remove Audio: {in_name} ===")
     
     info = get_video_info(input_file)
     print(f"Duration: {info['duration']}")
@@ -2042,17 +2521,20 @@ def remove_audio(input_file):
     print()
     
     output_filename = safe_input("Enter output filename (with extension): ").strip()
-    if not output_filename:
-        base_name = os.path.splitext(os.path.basename(input_file))[0]
-        extension = os.path.splitext(os.path.basename(input_file))[1]
-        output_filename = f"{base_name}_silent{extension}"
+    default_name = not output_filename
+    if default_name:
+        output_filename = f"{in_base}_silent{in_ext}"
         print(f"Using default filename: {output_filename}")
     
-    output_path = os.path.join(os.path.dirname(input_file), output_filename)
+    output_path = os.path.join(in_dir, output_filename)
+    # Only a previous run's default output can be assumed to be this operation's result
+    if default_name and is_output_up_to_date(input_file, output_path):
+        print(f"✓ {os.path.basename(output_path)} is already up-to-date. Skipping.")
+        return
     output_path = validate_output_path(output_path)
     
     print(f"\n=== Audio Removal Summary ===")
-    print(f"Input: {os.path.basename(input_file)}")
+    print(f"Input: {in_name}")
     print(f"Output: {os.path.basename(output_path)}")
     print("Note: Video will be copied without re-encoding (fast, no quality loss)")
     
@@ -2064,7 +2546,7 @@ def remove_audio(input_file):
     print("Removing audio...")
     try:
         cmd = ["ffmpeg", "-i", input_file, "-an", "-c:v", "copy", output_path]
-        subprocess.run(cmd, check=True, cwd=os.path.dirname(input_file))
+        subprocess.run(cmd, check=True)
         print(f"✓ Audio removal completed successfully!")
         print(f"Output saved: {output_path}")
         
@@ -2073,7 +2555,9 @@ def remove_audio(input_file):
 
 def change_framerate(input_file):
     """Change video frame rate."""
-    print(f"\n=== Change Frame Rate: {os.path.basename(input_file)} ===")
+    in_dir, in_name = os.path.split(input_file)
+    in_base, in_ext = os.path.splitext(in_name)
+    print(f"\n=== Change Frame Rate: {in_name} ===")
     
     info = get_video_info(input_file)
     print(f"Duration: {info['duration']}")
@@ -2101,16 +2585,14 @@ def change_framerate(input_file):
     
     output_filename = safe_input("Enter output filename (with extension): ").strip()
     if not output_filename:
-        base_name = os.path.splitext(os.path.basename(input_file))[0]
-        extension = os.path.splitext(os.path.basename(input_file))[1]
-        output_filename = f"{base_name}_{fps}fps{extension}"
+        output_filename = f"{in_base}_{fps}fps{in_ext}"
         print(f"Using default filename: {output_filename}")
     
-    output_path = os.path.join(os.path.dirname(input_file), output_filename)
+    output_path = os.path.join(in_dir, output_filename)
     output_path = validate_output_path(output_path)
     
     print(f"\n=== Frame Rate Change Summary ===")
-    print(f"Input: {os.path.basename(input_file)}")
+    print(f"Input: {in_name}")
     print(f"Target frame rate: {fps} fps")
     print(f"Output: {os.path.basename(output_path)}")
     print("Note: Audio will be copied without changes")
@@ -2123,7 +2605,7 @@ def change_framerate(input_file):
     print("Changing frame rate...")
     try:
         cmd = ["ffmpeg", "-i", input_file, "-vf", f"fps={fps}", "-c:a", "copy", output_path]
-        subprocess.run(cmd, check=True, cwd=os.path.dirname(input_file))
+        subprocess.run(cmd, check=True)
         print(f"✓ Frame rate change completed successfully!")
         print(f"Output saved: {output_path}")
         
@@ -2132,7 +2614,9 @@ def change_framerate(input_file):
 
 def slow_down_video(input_file):
     """Slow down video and audio."""
-    print(f"\n=== Slow Down Video: {os.path.basename(input_file)} ===")
+    in_dir, in_name = os.path.split(input_file)
+    in_base, in_ext = os.path.splitext(in_name)
+    print(f"\n=== Slow Down Video: {in_name} ===")
     
     info = get_video_info(input_file)
     print(f"Duration: {info['duration']}")
@@ -2169,16 +2653,14 @@ def slow_down_video(input_file):
     
     output_filename = safe_input("Enter output filename (with extension): ").strip()
     if not output_filename:
-        base_name = os.path.splitext(os.path.basename(input_file))[0]
-        extension = os.path.splitext(os.path.basename(input_file))[1]
-        output_filename = f"{base_name}_slow_{int(percentage_slower)}pct{extension}"
+        output_filename = f"{in_base}_slow_{int(percentage_slower)}pct{in_ext}"
         print(f"Using default filename: {output_filename}")
     
-    output_path = os.path.join(os.path.dirname(input_file), output_filename)
+    output_path = os.path.join(in_dir, output_filename)
     output_path = validate_output_path(output_path)
     
     print(f"\n=== Slow Down Summary ===")
-    print(f"Input: {os.path.basename(input_file)}")
+    print(f"Input: {in_name}")
     print(f"Speed: {speed_multiplier:.2f}x ({percentage_slower:.1f}% slower)")
     print(f"Output: {os.path.basename(output_path)}")
     print("Note: Both video and audio will be slowed down proportionally")
@@ -2195,13 +2677,15 @@ def slow_down_video(input_file):
                "-filter_complex", f"[0:v]setpts={pts_multiplier}*PTS[v];[0:a]atempo={speed_multiplier}[a]",
                "-map", "[v]", "-map", "[a]", output_path]
         
-        subprocess.run(cmd, check=True, cwd=os.path.dirname(input_file))
+        subprocess.run(cmd, check=True)
         print(f"✓ Video slowdown completed successfully!")
         print(f"Output saved: {output_path}")
         
     except subprocess.CalledProcessError as e:
         print(f"✗ Error during video slowdown: {e}")
 
+VIDEO_EXTENSIONS = ('.mp4', '.mkv', '.avi', '.mov', '.webm', '.m4v', '.flv')
+
 def get_recent_video_files(limit=20):
     """Get recently downloaded video files from both directories."""
     video_files = []
@@ -2210,25 +2694,24 @@ def get_recent_video_files(limit=20):
     directories = [DEFAULT_VIDEO_DIR, DEFAULT_MUSIC_DIR]
     
     for directory in directories:
-        if os.path.exists(directory):
-            # Look for video files recursively
-            patterns = ['*.mp4', '*.mkv', '*.avi', '*.mov', '*.webm', '*.m4v', '*.flv']
-            
-            for pattern in patterns:
-                files = glob.glob(os.path.join(directory, '**', pattern), recursive=True)
-                for file in files:
-                    try:
-                        mtime = os.path.getmtime(file)
-                        size = os.path.getsize(file)
-                        video_files.append({
-                            'path': file,
-                            'name': os.path.basename(file),
-                            'mtime': mtime,
-                            'size': size,
-                            'directory': os.path.dirname(file)
-                        })
-                    except OSError:
-                        continue
+        # Look for video files recursively in one walk, skipping hidden files and folders
+        for root, dirs, files in os.walk(directory, followlinks=True):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            for name in files:
+                if name.startswith('.') or not name.endswith(VIDEO_EXTENSIONS):
+                    continue
+                file = os.path.join(root, name)
+                try:
+                    st = os.stat(file)
+                except OSError:
+                    continue
+                video_files.append({
+                    'path': file,
+                    'name': name,
+                    'mtime': st.st_mtime,
+                    'size': st.st_size,
+                    'directory': root
+                })
     
     # Sort by modification time (newest first) and limit
     video_files.sort(key=lambda x: x['mtime'], reverse=True)
@@ -2293,42 +2776,46 @@ def select_video_file():
             print("Invalid folder path.")
             return None
         
-        # Find video files in folder
-        video_files = []
-        patterns = ['*.mp4', '*.mkv', '*.avi', '*.mov', '*.webm', '*.m4v', '*.flv']
-        
-        for pattern in patterns:
-            files = glob.glob(os.path.join(folder_path, pattern))
-            video_files.extend(files)
+        # Find video files in folder (scandir entries carry their own name and cached stat)
+        with os.scandir(folder_path) as it:
+            entries = [entry for entry in it
+                       if entry.is_file() and entry.name.lower().endswith(VIDEO_EXTENSIONS)]
         
-        if not video_files:
+        if not entries:
             print("No video files found in the specified folder.")
             return None
         
-        video_files.sort()
-        
-        print(f"\n=== Video Files in {folder_path} ===")
-        for i, file_path in enumerate(video_files, 1):
-            file_size = os.path.getsize(file_path) / (1024 * 1024)
-            print(f"{i:2d}. {os.path.basename(file_path)} ({file_size:.1f} MB)")
-        
-        print("99. Back")
-        
-        file_choice = safe_input(f"\nSelect file (1-{len(video_files)}, 99): ").strip()
+        entries.sort(key=lambda entry: entry.name)
+        video_files = [entry.path for entry in entries]
         
-        if file_choice == "99":
-            return None
-        
-        try:
-            index = int(file_choice) - 1
-            if 0 <= index < len(video_files):
-                return video_files[index]
-            else:
-                print("Invalid selection.")
+        # Re-list the folder after showing metadata so a file can still be picked from it
+        while True:
+            print(f"\n=== Video Files in {folder_path} ===")
+            for i, entry in enumerate(entries, 1):
+                file_size = entry.stat().st_size / (1024 * 1024)
+                print(f"{i:2d}. {entry.name} ({file_size:.1f} MB)")
+            
+            print(f"{len(video_files) + 1:2d}. Show metadata for all files")
+            print("99. Back")
+            
+            file_choice = safe_input(f"\nSelect file (1-{len(video_files)}, {len(video_files) + 1}, 99): ").strip()
+            
+            if file_choice == "99":
+                return None
+            elif file_choice == str(len(video_files) + 1):
+                show_bulk_metadata(video_files, _detect_metadata_tools())
+                continue  # Back to this folder's file list
+            
+            try:
+                index = int(file_choice) - 1
+                if 0 <= index < len(video_files):
+                    return video_files[index]
+                else:
+                    print("Invalid selection.")
+                    return None
+            except ValueError:
+                print("Invalid input.")
                 return None
-        except ValueError:
-            print("Invalid input.")
-            return None
             
     elif choice == "3":
         # Manual path entry
@@ -2348,6 +2835,13 @@ def select_video_file():
         print("Invalid choice.")
         return None
 
+METADATA_TOOLS = ("mediainfo", "ffprobe", "exiftool")
+
+def _detect_metadata_tools():
+    """Return the metadata tools found on PATH, in order of preference."""
+    # mediainfo is preferred for comprehensive info, ffprobe ships with ffmpeg
+    return tuple(tool for tool in METADATA_TOOLS if _cap(tool))
+
 def show_file_metadata():
     """Show metadata for a video file with basic or full info options."""
     print("\n=== File Metadata Viewer ===")
@@ -2389,31 +2883,13 @@ def show_file_metadata():
     print(f"\nAnalysing: {os.path.basename(file_path)}")
     print("=" * 60)
     
-    # Check which tools are available
-    tools_available = []
-    
-    # Check for mediainfo (preferred for comprehensive info)
-    try:
-        subprocess.run(["mediainfo", "--version"], capture_output=True, check=True)
-        tools_available.append("mediainfo")
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
-    
-    # Check for ffprobe (part of ffmpeg)
-    try:
-        subprocess.run(["ffprobe", "-version"], capture_output=True, check=True)
-        tools_available.append("ffprobe")
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
-    
-    # Check for exiftool
-    try:
-        subprocess.run(["exiftool", "-ver"], capture_output=True, check=True)
-        tools_available.append("exiftool")
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
+    # Check which tools are available (cached for the session)
+    tools_available = _detect_metadata_tools()
     
     if not tools_available:
+        # Forget the negative result so a tool installed mid-session is picked up next time
+        for tool in METADATA_TOOLS:
+            _CAPS.pop(tool, None)
         print("No metadata tools found. Please install at least one of:")
         print("- mediainfo: sudo apt install mediainfo")
         print("- ffprobe (part of ffmpeg): sudo apt install ffmpeg")
@@ -2426,66 +2902,271 @@ def show_file_metadata():
     else:
         show_full_metadata(file_path, tools_available)
 
-def show_basic_metadata(file_path, tools_available):
-    """Show basic metadata information."""
-    try:
-        if "mediainfo" in tools_available:
-            result = subprocess.run(["mediainfo", file_path], capture_output=True, text=True, timeout=30)
-            if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                
-                # Extract only basic info fields
-                basic_fields = [
-                    'Complete name', 'Format', 'Format version', 'File size', 
-                    'Duration', 'Overall bit rate', 'Frame rate'
-                ]
+# MediaInfo fields to show; keys containing any of these names are kept
+MEDIAINFO_BASIC_FIELDS = (
+    'Complete name', 'Format', 'Format version', 'File size', 
+    'Duration', 'Overall bit rate', 'Frame rate'
+)
+MEDIAINFO_FULL_FIELDS = (
+    'Complete name', 'Format', 'Format profile', 'Codec ID', 
+    'File size', 'Duration', 'Overall bit rate', 'Frame rate',
+    'Bit rate', 'Width', 'Height', 'Display aspect ratio',
+    'Color space', 'Chroma subsampling', 'Bit depth', 
+    'Scan type', 'Writing library', 'Writing application',
+    'Sampling rate', 'Channel layout', 'Compression mode'
+)
+# One compiled alternation per view instead of a substring test per field per line
+MEDIAINFO_BASIC_RE = re.compile("|".join(map(re.escape, MEDIAINFO_BASIC_FIELDS)))
+MEDIAINFO_FULL_RE = re.compile("|".join(map(re.escape, MEDIAINFO_FULL_FIELDS)))
+
+# Fields shown in the full ffprobe metadata view, in display order
+FFPROBE_FORMAT_FIELDS = (
+    'filename', 'nb_streams', 'format_name', 'format_long_name',
+    'duration', 'size', 'bit_rate'
+)
+FFPROBE_VIDEO_FIELDS = (
+    'codec_name', 'codec_long_name', 'width', 'height',
+    'r_frame_rate', 'avg_frame_rate', 'pix_fmt', 'bit_rate'
+)
+FFPROBE_AUDIO_FIELDS = (
+    'codec_name', 'codec_long_name', 'sample_rate',
+    'channels', 'channel_layout', 'bit_rate'
+)
+FFPROBE_STREAM_FIELDS = tuple(dict.fromkeys(FFPROBE_VIDEO_FIELDS + FFPROBE_AUDIO_FIELDS))
+
+def iter_command_output(cmd, timeout=None):
+    """Yield a command's stdout lines as they are produced, without buffering it all.
+    
+    Raises subprocess.TimeoutExpired if the command runs longer than timeout seconds,
+    and subprocess.CalledProcessError if it exits with a non-zero status.
+    """
+    timed_out = []
+    
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, 
+                          text=True, bufsize=1) as process:
+        def kill_on_timeout():
+            timed_out.append(True)
+            process.kill()
+        
+        timer = threading.Timer(timeout, kill_on_timeout) if timeout else None
+        if timer:
+            timer.start()
+        try:
+            yield from process.stdout
+        finally:
+            if timer:
+                timer.cancel()
+    
+    if timed_out:
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd)
+
+@functools.lru_cache(maxsize=256)
+def _probe_basic(file_path, mtime_ns, size, tools_available):
+    """Return the basic metadata report for file_path as a tuple of display lines.
+    
+    mtime_ns and size only key the cache, so an edited file is probed again.
+    If a tool fails, CalledProcessError is raised with the partial report as its output,
+    so the failure is never cached.
+    """
+    lines = []
+    failed = []
+    
+    if "mediainfo" in tools_available:
+        try:
+            for line in iter_command_output(["mediainfo", file_path], timeout=30):
+                line = line.strip()
+                if ':' in line:
+                    key, value = line.split(':', 1)
+                    key = key.strip()
+                    value = value.strip()
+                    
+                    # Extract only basic info fields
+                    if MEDIAINFO_BASIC_RE.search(key):
+                        lines.append(f"{key:<35} : {value}")
+        except subprocess.CalledProcessError:
+            lines.append("Failed to run mediainfo")
+            failed.append("mediainfo")
+    
+    elif "ffprobe" in tools_available:
+        # Fallback to ffprobe if mediainfo not available
+        result = subprocess.run([
+            "ffprobe", "-v", "quiet", "-print_format", "json", 
+            "-show_entries", "format=format_name,duration,size,bit_rate", file_path
+        ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=30)
+        
+        if result.returncode == 0:
+            format_info = json.loads(result.stdout).get('format', {})
+            lines.append(f"Complete name                       : {file_path}")
+            
+            if 'format_name' in format_info:
+                lines.append(f"Format                              : {format_info['format_name']}")
+            if 'duration' in format_info:
+                duration_sec = float(format_info['duration'])
+                minutes = int(duration_sec // 60)
+                seconds = int(duration_sec % 60)
+                ms = int((duration_sec % 1) * 1000)
+                lines.append(f"Duration                            : {minutes} min {seconds} s {ms} ms")
+            if 'size' in format_info:
+                size_mb = int(format_info['size']) / (1024 * 1024)
+                lines.append(f"File size                           : {size_mb:.2f} MiB")
+            if 'bit_rate' in format_info:
+                bit_rate_kb = int(format_info['bit_rate']) // 1000
+                lines.append(f"Overall bit rate                    : {bit_rate_kb} kb/s")
+        else:
+            lines.append("Failed to run ffprobe")
+            failed.append("ffprobe")
+    else:
+        lines.append("No suitable tools available for basic metadata extraction")
+    
+    if failed:
+        raise subprocess.CalledProcessError(1, failed, output=tuple(lines))
+    return tuple(lines)
+
+@functools.lru_cache(maxsize=256)
+def _probe_full(file_path, mtime_ns, size, tools_available):
+    """Return the full metadata report for file_path as a tuple of display lines.
+    
+    mtime_ns and size only key the cache, so an edited file is probed again.
+    If a tool fails, CalledProcessError is raised with the partial report as its output,
+    so the failure is never cached.
+    """
+    lines = []
+    failed = []
+    
+    if "mediainfo" in tools_available:
+        lines.append("\n--- MediaInfo ---")
+        try:
+            # Filter out less useful information and format nicely
+            current_section = ""
+            
+            for line in iter_command_output(["mediainfo", file_path], timeout=30):
+                line = line.strip()
+                if not line:
+                    continue
                 
-                for line in lines:
-                    line = line.strip()
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        key = key.strip()
-                        value = value.strip()
-                        
-                        if any(field in key for field in basic_fields):
-                            print(f"{key:<35} : {value}")
-            else:
-                print("Failed to run mediainfo")
-        
-        elif "ffprobe" in tools_available:
-            # Fallback to ffprobe if mediainfo not available
-            result = subprocess.run([
-                "ffprobe", "-v", "quiet", "-print_format", "default", 
-                "-show_format", file_path
-            ], capture_output=True, text=True, timeout=30)
+                # Section headers (General, Video, Audio, etc.)
+                if not line.startswith(' ') and ':' not in line and line:
+                    current_section = line
+                    if current_section in ['General', 'Video', 'Audio']:
+                        lines.append(f"\n{current_section}")
+                # Useful metadata fields
+                elif ':' in line and current_section in ['General', 'Video', 'Audio']:
+                    key, value = line.split(':', 1)
+                    key = key.strip()
+                    value = value.strip()
+                    
+                    # Filter for useful fields
+                    if MEDIAINFO_FULL_RE.search(key):
+                        lines.append(f"{key:<35} : {value}")
+        except subprocess.CalledProcessError:
+            lines.append("Failed to run mediainfo")
+            failed.append("mediainfo")
+    
+    if "ffprobe" in tools_available:
+        lines.append("\n--- FFprobe ---")
+        result = subprocess.run([
+            "ffprobe", "-v", "quiet", "-print_format", "json", 
+            "-show_entries", f"format={','.join(FFPROBE_FORMAT_FIELDS)}"
+                             f":stream=codec_type,{','.join(FFPROBE_STREAM_FIELDS)}",
+            file_path
+        ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=30)
+        
+        if result.returncode == 0:
+            data = json.loads(result.stdout)
             
-            if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                print(f"Complete name                       : {file_path}")
+            format_info = data.get('format', {})
+            lines.append("\nFormat:")
+            for key in FFPROBE_FORMAT_FIELDS:
+                if key in format_info:
+                    lines.append(f"  {key:<20} : {format_info[key]}")
+            
+            for stream in data.get('streams', []):
+                codec_type = stream.get('codec_type')
+                if codec_type == "video":
+                    lines.append("\nVideo Stream:")
+                    useful_fields = FFPROBE_VIDEO_FIELDS
+                elif codec_type == "audio":
+                    lines.append("\nAudio Stream:")
+                    useful_fields = FFPROBE_AUDIO_FIELDS
+                else:
+                    continue
                 
-                for line in lines:
-                    line = line.strip()
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        if key == "format_name":
-                            print(f"Format                              : {value}")
-                        elif key == "duration":
-                            duration_sec = float(value)
-                            minutes = int(duration_sec // 60)
-                            seconds = int(duration_sec % 60)
-                            ms = int((duration_sec % 1) * 1000)
-                            print(f"Duration                            : {minutes} min {seconds} s {ms} ms")
-                        elif key == "size":
-                            size_mb = int(value) / (1024 * 1024)
-                            print(f"File size                           : {size_mb:.2f} MiB")
-                        elif key == "bit_rate":
-                            bit_rate_kb = int(value) // 1000
-                            print(f"Overall bit rate                    : {bit_rate_kb} kb/s")
-            else:
-                print("Failed to run ffprobe")
+                for key in useful_fields:
+                    if key in stream:
+                        lines.append(f"  {key:<20} : {stream[key]}")
         else:
-            print("No suitable tools available for basic metadata extraction")
+            lines.append("Failed to run ffprobe")
+            failed.append("ffprobe")
+    
+    if failed:
+        raise subprocess.CalledProcessError(1, failed, output=tuple(lines))
+    return tuple(lines)
+
+def _get_metadata_db():
+    """Open the on-disk metadata cache once per process, or return None if unavailable."""
+    global _metadata_db, _metadata_db_checked
+    
+    if not _metadata_db_checked:
+        _metadata_db_checked = True
+        import sqlite3  # Only needed once metadata is actually requested
+        try:
+            _ensure_dir(LOUTUBE_CACHE_DIR)
+            db = sqlite3.connect(METADATA_CACHE_PATH)
+            # Rows of the old path-less table would show a renamed file's old path
+            db.execute("DROP TABLE IF EXISTS meta")
+            db.execute("CREATE TABLE IF NOT EXISTS metadata("
+                       "kind TEXT, tools TEXT, path TEXT, dev INT, ino INT, mtime INT, size INT, "
+                       "payload BLOB, PRIMARY KEY(kind, tools, path, dev, ino, mtime, size))")
+            _metadata_db = db
+        except (OSError, sqlite3.Error):
+            _metadata_db = None
+    
+    return _metadata_db
+
+def _cached_metadata_lines(kind, probe, file_path, tools_available):
+    """Return metadata lines from the on-disk cache, running probe and storing its result on a miss."""
+    import sqlite3
+    stat = os.stat(file_path)
+    real_path = os.path.realpath(file_path)
+    tools = tuple(tools_available)
+    # Any edit to the file changes mtime or size, so stale rows are simply never looked up again.
+    # The reports include the file's path, so a renamed file is looked up afresh too.
+    key = (kind, ",".join(tools), real_path, stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    db = _get_metadata_db()
+    
+    if db is not None:
+        try:
+            row = db.execute("SELECT payload FROM metadata WHERE kind=? AND tools=? AND path=? "
+                             "AND dev=? AND ino=? AND mtime=? AND size=?", key).fetchone()
+            if row:
+                return tuple(json.loads(row[0]))
+        except sqlite3.Error:
+            pass
+    
+    try:
+        lines = probe(real_path, stat.st_mtime_ns, stat.st_size, tools)
+    except subprocess.CalledProcessError as e:
+        # A report where one of the tools failed is shown but kept out of both caches,
+        # so the next request probes the file again
+        return e.output
+    
+    if db is not None:
+        try:
+            with db:
+                db.execute("INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                           (*key, json.dumps(lines)))
+        except sqlite3.Error:
+            pass
     
+    return lines
+
+def show_basic_metadata(file_path, tools_available):
+    """Show basic metadata information."""
+    try:
+        for line in _cached_metadata_lines("basic", _probe_basic, file_path, tools_available):
+            print(line)
     except subprocess.TimeoutExpired:
         print("Timeout occurred while analysing file")
     except Exception as e:
@@ -2497,115 +3178,8 @@ def show_basic_metadata(file_path, tools_available):
 def show_full_metadata(file_path, tools_available):
     """Show comprehensive metadata information."""
     try:
-        if "mediainfo" in tools_available:
-            print("\n--- MediaInfo ---")
-            result = subprocess.run(["mediainfo", file_path], capture_output=True, text=True, timeout=30)
-            if result.returncode == 0:
-                # Filter out less useful information and format nicely
-                lines = result.stdout.split('\n')
-                useful_lines = []
-                current_section = ""
-                
-                for line in lines:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    # Section headers (General, Video, Audio, etc.)
-                    if not line.startswith(' ') and ':' not in line and line:
-                        current_section = line
-                        if current_section in ['General', 'Video', 'Audio']:
-                            useful_lines.append(f"\n{current_section}")
-                    # Useful metadata fields
-                    elif ':' in line and current_section in ['General', 'Video', 'Audio']:
-                        key, value = line.split(':', 1)
-                        key = key.strip()
-                        value = value.strip()
-                        
-                        # Filter for useful fields
-                        useful_fields = [
-                            'Complete name', 'Format', 'Format profile', 'Codec ID', 
-                            'File size', 'Duration', 'Overall bit rate', 'Frame rate',
-                            'Bit rate', 'Width', 'Height', 'Display aspect ratio',
-                            'Color space', 'Chroma subsampling', 'Bit depth', 
-                            'Scan type', 'Writing library', 'Writing application',
-                            'Sampling rate', 'Channel layout', 'Compression mode'
-                        ]
-                        
-                        if any(field in key for field in useful_fields):
-                            useful_lines.append(f"{key:<35} : {value}")
-                
-                for line in useful_lines:
-                    print(line)
-            else:
-                print("Failed to run mediainfo")
-        
-        if "ffprobe" in tools_available:
-            print("\n--- FFprobe ---")
-            result = subprocess.run([
-                "ffprobe", "-v", "quiet", "-print_format", "default", 
-                "-show_format", "-show_streams", file_path
-            ], capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                in_format = False
-                in_video_stream = False
-                in_audio_stream = False
-                
-                for line in lines:
-                    line = line.strip()
-                    if line == "[FORMAT]":
-                        in_format = True
-                        print("\nFormat:")
-                        continue
-                    elif line == "[/FORMAT]":
-                        in_format = False
-                        continue
-                    elif line == "[STREAM]":
-                        continue
-                    elif line == "[/STREAM]":
-                        in_video_stream = False
-                        in_audio_stream = False
-                        continue
-                    
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        
-                        if in_format:
-                            useful_format_fields = [
-                                'filename', 'nb_streams', 'format_name', 'format_long_name',
-                                'duration', 'size', 'bit_rate'
-                            ]
-                            if key in useful_format_fields:
-                                print(f"  {key:<20} : {value}")
-                        
-                        elif key == "codec_type":
-                            if value == "video":
-                                in_video_stream = True
-                                print(f"\nVideo Stream:")
-                            elif value == "audio":
-                                in_audio_stream = True
-                                print(f"\nAudio Stream:")
-                        
-                        elif in_video_stream:
-                            useful_video_fields = [
-                                'codec_name', 'codec_long_name', 'width', 'height',
-                                'r_frame_rate', 'avg_frame_rate', 'pix_fmt', 'bit_rate'
-                            ]
-                            if key in useful_video_fields:
-                                print(f"  {key:<20} : {value}")
-                        
-                        elif in_audio_stream:
-                            useful_audio_fields = [
-                                'codec_name', 'codec_long_name', 'sample_rate',
-                                'channels', 'channel_layout', 'bit_rate'
-                            ]
-                            if key in useful_audio_fields:
-                                print(f"  {key:<20} : {value}")
-            else:
-                print("Failed to run ffprobe")
-    
+        for line in _cached_metadata_lines("full", _probe_full, file_path, tools_available):
+            print(line)
     except subprocess.TimeoutExpired:
         print("Timeout occurred while analysing file")
     except Exception as e:
@@ -2614,9 +3188,136 @@ def show_full_metadata(file_path, tools_available):
     print("\n" + "=" * 60)
     input("Press Enter to continue...")
 
+def _bulk_metadata_records(paths, tools_available):
+    """Yield (path, fields) for every file from a single exiftool or mediainfo run."""
+    if "exiftool" in tools_available:
+        result = subprocess.run(["exiftool", "-j", "-fast", *paths], 
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=120)
+        # exiftool exits non-zero if any single file failed, but still reports the rest
+        for entry in json.loads(result.stdout or "[]"):
+            yield entry.get('SourceFile', ''), {
+                'Format': entry.get('FileType', ''),
+                'File size': entry.get('FileSize', ''),
+                'Duration': entry.get('Duration', ''),
+                'Resolution': entry.get('ImageSize', ''),
+                'Frame rate': entry.get('VideoFrameRate', ''),
+            }
+    
+    elif "mediainfo" in tools_available:
+        result = subprocess.run(["mediainfo", "--Output=JSON", *paths], 
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=120)
+        entries = json.loads(result.stdout or "[]")
+        if isinstance(entries, dict):  # Single file produces an object, not a list
+            entries = [entries]
+        for entry in entries:
+            media = entry.get('media') or {}
+            tracks = {track.get('@type'): track for track in media.get('track', [])}
+            general = tracks.get('General', {})
+            video = tracks.get('Video', {})
+            yield media.get('@ref', ''), {
+                'Format': general.get('Format', ''),
+                'File size': general.get('FileSize', ''),
+                'Duration': general.get('Duration', ''),
+                'Resolution': f"{video['Width']}x{video['Height']}" if 'Width' in video else '',
+                'Frame rate': general.get('FrameRate', ''),
+            }
+
+def show_bulk_metadata(paths, tools_available):
+    """Show basic metadata for many files using one metadata tool invocation."""
+    if "exiftool" not in tools_available and "mediainfo" not in tools_available:
+        print("Showing metadata for multiple files requires exiftool or mediainfo:")
+        print("- mediainfo: sudo apt install mediainfo")
+        print("- exiftool: sudo apt install libimage-exiftool-perl")
+        return
+    
+    print(f"\nAnalysing {len(paths)} files...")
+    print("=" * 60)
+    
+    try:
+        for path, fields in _bulk_metadata_records(paths, tools_available):
+            print(f"\n{os.path.basename(path)}")
+            for key, value in fields.items():
+                if value:
+                    print(f"  {key:<20} : {value}")
+    except subprocess.TimeoutExpired:
+        print("Timeout occurred while analysing files")
+    except Exception as e:
+        print(f"Error analysing files: {e}")
+    
+    print("\n" + "=" * 60)
+    input("Press Enter to continue...")
+
+# Separators written between frames of colored and monochrome ASCII animations
+SEP_COLOR = "\n" + "=" * 60 + "\n"
+SEP_MONO = "\n" + "-" * 60 + "\n"
+
+def ascii_animation_header(name, frame_count, width, height):
+    """Return the comment header written at the top of an ASCII animation file."""
+    return (f"# ASCII Art Animation: {name}\n"
+            f"# Frames: {frame_count} | Resolution: {width}x{height}\n"
+            "# Generated by Loutube ASCII Art Converter\n\n")
+
+# Characters ordered from darkest to brightest pixel; no '-' or '=', which would form frame separators
+ASCII_RAMP = " .^,:;Il!i><~+_*?][}{1)(|/tfjrxnuvczXYUJCLQ0OZmwqpdbkhao#MW&%B@$"
+
+# Every gray level mapped to its ramp character, so each frame is a single C-level bytes.translate
+_ASCII_LUT = bytes(ord(ASCII_RAMP[pixel * len(ASCII_RAMP) >> 8]) for pixel in range(256))
+
+def iter_gray_ascii_frames(input_file, width, height, fps=2):
+    """Yield monochrome ASCII frames decoded straight from ffmpeg's raw grayscale output."""
+    cmd = ["ffmpeg", "-v", "error", "-i", input_file,
+           "-vf", f"scale={width}:{height}:flags=lanczos,fps={fps}",
+           "-f", "rawvideo", "-pix_fmt", "gray", "-"]
+    frame_size = width * height
+    
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE) as process:
+        while True:
+            frame = process.stdout.read(frame_size)
+            if len(frame) < frame_size:
+                break
+            chars = frame.translate(_ASCII_LUT).decode("ascii")
+            yield "\n".join(chars[y * width:(y + 1) * width] for y in range(height))
+    
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd)
+
+def _img2txt_command(frame_path, width, height):
+    """Build the img2txt command converting a single frame to colored ASCII."""
+    return ["img2txt", "--width", str(width), "--height", str(height), 
+            "--gamma", "1.0", frame_path]
+
+def _jp2a_command(frame_path, width, height):
+    """Build the jp2a command converting a single frame to monochrome ASCII."""
+    return ["jp2a", "--width", str(width), "--height", str(height), frame_path]
+
+async def _run_frame_commands(commands, max_concurrent):
+    """Run the per-frame commands with at most max_concurrent children alive at once."""
+    import asyncio
+    semaphore = asyncio.Semaphore(max_concurrent)
+    
+    async def run_one(cmd):
+        async with semaphore:
+            process = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL)
+            stdout, _ = await process.communicate()
+            return stdout.decode('utf-8', errors='replace') if process.returncode == 0 else None
+    
+    # gather returns results in submission order, so frames stay in sequence
+    return await asyncio.gather(*(run_one(cmd) for cmd in commands))
+
+def convert_frames_parallel(build_command, frame_paths, width, height):
+    """Convert every frame concurrently, keeping frame order and dropping failures."""
+    # asyncio is the single largest import here, so only load it when converting frames
+    import asyncio
+    commands = [build_command(frame_path, width, height) for frame_path in frame_paths]
+    results = asyncio.run(_run_frame_commands(commands, os.cpu_count() or 4))
+    return [frame for frame in results if frame is not None]
+
 def ascii_art_converter(input_file):
     """Convert video to colored ASCII art that plays back in terminal."""
-    print(f"\n=== ASCII Art Video Converter: {os.path.basename(input_file)} ===")
+    in_dir, in_name = os.path.split(input_file)
+    in_base, in_ext = os.path.splitext(in_name)
+    print(f"\n=== ASCII Art Video Converter: {in_name} ===")
     
     info = get_video_info(input_file)
     print(f"Duration: {info['duration']}")
@@ -2660,14 +3361,13 @@ def ascii_art_converter(input_file):
     
     output_filename = safe_input("Enter output filename (without extension): ").strip()
     if not output_filename:
-        base_name = os.path.splitext(os.path.basename(input_file))[0]
-        output_filename = f"{base_name}_ascii"
+        output_filename = f"{in_base}_ascii"
         print(f"Using default filename: {output_filename}")
     
-    output_dir = os.path.dirname(input_file)
+    output_dir = in_dir
     
     print(f"\n=== ASCII Conversion Summary ===")
-    print(f"Input: {os.path.basename(input_file)}")
+    print(f"Input: {in_name}")
     print(f"ASCII size: {width}x{height} characters")
     print(f"Output: {output_filename}.txt (colored) and/or {output_filename}_mono.txt")
     print("Note: Large videos may take significant time to process")
@@ -2696,47 +3396,34 @@ def ascii_art_converter(input_file):
                    "-vf", f"scale={width}:{height}:flags=lanczos,fps=2", 
                    "-y", os.path.join(frames_dir, "frame_%04d.png")]
             
-            subprocess.run(cmd, check=True, cwd=output_dir)
+            run_ffmpeg_with_progress(cmd, info['duration_seconds'])
             
             # Try to use img2txt if available (from libcaca-utils)
-            try:
-                subprocess.run(["img2txt", "--version"], capture_output=True, check=True)
-                
+            if _cap("img2txt"):
                 # Convert each frame to ASCII
-                ascii_frames = []
-                frame_files = sorted([f for f in os.listdir(frames_dir) if f.endswith('.png')])
-                
-                for frame_file in frame_files:
-                    frame_path = os.path.join(frames_dir, frame_file)
-                    result = subprocess.run(["img2txt", "--width", str(width), "--height", str(height), 
-                                           "--gamma", "1.0", frame_path], 
-                                          capture_output=True, text=True)
-                    if result.returncode == 0:
-                        ascii_frames.append(result.stdout)
+                # ffmpeg's zero-padded frame_%04d names sort in playback order
+                frame_paths = sorted(e.path for e in os.scandir(frames_dir) if e.name.endswith('.png'))
+                ascii_frames = convert_frames_parallel(_img2txt_command, frame_paths, width, height)
                 
                 # Save ASCII animation with frame separators
                 with open(colored_output, 'w') as f:
-                    f.write(f"# ASCII Art Animation: {os.path.basename(input_file)}\n")
-                    f.write(f"# Frames: {len(ascii_frames)} | Resolution: {width}x{height}\n")
-                    f.write("# Generated by Loutube ASCII Art Converter\n\n")
-                    for i, frame in enumerate(ascii_frames):
-                        f.write(frame)
-                        if i < len(ascii_frames) - 1:  # Don't add separator after last frame
-                            f.write("\n" + "="*60 + "\n")
+                    f.write(ascii_animation_header(in_name, len(ascii_frames), width, height))
+                    f.write(SEP_COLOR.join(ascii_frames))
                 
                 print(f"✓ Colored ASCII animation saved: {colored_output}")
                 
-            except (subprocess.CalledProcessError, FileNotFoundError):
+            else:
                 print("img2txt not found. Install libcaca-utils: sudo apt install libcaca-utils")
                 # Fallback: create a simple text representation
                 with open(colored_output, 'w') as f:
-                    f.write(f"ASCII Art Video: {os.path.basename(input_file)}\n")
+                    f.write(f"ASCII Art Video: {in_name}\n")
                     f.write(f"Frames extracted to: {frames_dir}\n")
                     f.write("Install 'libcaca-utils' package for full ASCII conversion\n")
                 print(f"✓ Frame extraction completed: {frames_dir}")
             
-            # Clean up frames directory
-            shutil.rmtree(frames_dir, ignore_errors=True)
+            # Clean up frames directory, unless the monochrome pass below reuses it
+            if color_choice != "3":
+                shutil.rmtree(frames_dir, ignore_errors=True)
         
         # Create monochrome ASCII version using jp2a if available
         if color_choice in ["2", "3"]:
@@ -2745,77 +3432,50 @@ def ascii_art_converter(input_file):
             mono_output = validate_output_path(mono_output)
             
             # Try jp2a first (better ASCII art tool)
-            try:
-                subprocess.run(["jp2a", "--version"], capture_output=True, check=True)
-                
-                # Extract frames for jp2a conversion
-                frames_dir = os.path.join(output_dir, f"temp_frames_mono_{output_filename}")
-                os.makedirs(frames_dir, exist_ok=True)
-                
-                cmd = ["ffmpeg", "-i", input_file, 
-                       "-vf", f"scale={width}:{height}:flags=lanczos,fps=2", 
-                       "-y", os.path.join(frames_dir, "frame_%04d.jpg")]
-                
-                subprocess.run(cmd, check=True, cwd=output_dir)
+            if _cap("jp2a"):
+                if color_choice == "3":
+                    # Reuse the PNG frames already extracted for the colored pass
+                    frame_ext = '.png'
+                else:
+                    # Extract frames for jp2a conversion
+                    frames_dir = os.path.join(output_dir, f"temp_frames_mono_{output_filename}")
+                    os.makedirs(frames_dir, exist_ok=True)
+                    
+                    cmd = ["ffmpeg", "-i", input_file, 
+                           "-vf", f"scale={width}:{height}:flags=lanczos,fps=2", 
+                           "-y", os.path.join(frames_dir, "frame_%04d.jpg")]
+                    
+                    run_ffmpeg_with_progress(cmd, info['duration_seconds'])
+                    frame_ext = '.jpg'
                 
                 # Convert frames with jp2a
-                ascii_frames = []
-                frame_files = sorted([f for f in os.listdir(frames_dir) if f.endswith('.jpg')])
-                
-                for frame_file in frame_files:
-                    frame_path = os.path.join(frames_dir, frame_file)
-                    result = subprocess.run(["jp2a", "--width", str(width), "--height", str(height), 
-                                           frame_path], capture_output=True, text=True)
-                    if result.returncode == 0:
-                        ascii_frames.append(result.stdout)
+                frame_paths = sorted(e.path for e in os.scandir(frames_dir) if e.name.endswith(frame_ext))
+                ascii_frames = convert_frames_parallel(_jp2a_command, frame_paths, width, height)
                 
                 # Save ASCII animation with frame separators
                 with open(mono_output, 'w') as f:
-                    f.write(f"# ASCII Art Animation: {os.path.basename(input_file)}\n")
-                    f.write(f"# Frames: {len(ascii_frames)} | Resolution: {width}x{height}\n")
-                    f.write("# Generated by Loutube ASCII Art Converter\n\n")
-                    for i, frame in enumerate(ascii_frames):
-                        f.write(frame)
-                        if i < len(ascii_frames) - 1:  # Don't add separator after last frame
-                            f.write("\n" + "-"*60 + "\n")
+                    f.write(ascii_animation_header(in_name, len(ascii_frames), width, height))
+                    f.write(SEP_MONO.join(ascii_frames))
                 
                 print(f"✓ Monochrome ASCII animation saved: {mono_output}")
                 
                 # Clean up
                 shutil.rmtree(frames_dir, ignore_errors=True)
                 
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                print("jp2a not found. Creating alternative ASCII representation...")
+            else:
+                print("jp2a not found. Using built-in ASCII conversion...")
                 
-                # Fallback: Use FFmpeg to create a simple character representation
-                temp_frames = os.path.join(output_dir, f"temp_simple_{output_filename}.jpg")
+                # Fallback: decode grayscale frames straight from an ffmpeg pipe, no temp files
+                ascii_frames = list(iter_gray_ascii_frames(input_file, width, height))
                 
-                # Extract a single frame and create a simple representation
-                cmd = ["ffmpeg", "-i", input_file, "-vf", f"scale={width//4}:{height//4}", 
-                       "-vframes", "1", "-y", temp_frames]
-                subprocess.run(cmd, check=True, cwd=output_dir)
+                if color_choice == "3":
+                    shutil.rmtree(frames_dir, ignore_errors=True)
                 
                 with open(mono_output, 'w') as f:
-                    f.write(f"ASCII Art Video: {os.path.basename(input_file)}\n")
-                    f.write(f"Resolution: {width}x{height} characters\n")
-                    f.write("Install 'jp2a' for full ASCII conversion: sudo apt install jp2a\n")
-                    f.write("Or install 'libcaca-utils': sudo apt install libcaca-utils\n\n")
-                    
-                    # Simple character representation
-                    chars = "$@B%&WM#oahkbdpqwmZO0QLCJUYXzcvunxrjft/|()1{[]?*-_+~<>i!lI;:,^."
-                    for y in range(height//8):
-                        line = ""
-                        for x in range(width//4):
-                            # Simple pattern based on position
-                            intensity = (x + y) % len(chars)
-                            line += chars[intensity]
-                        f.write(line + "\n")
+                    f.write(ascii_animation_header(in_name, len(ascii_frames), width, height))
+                    f.write(SEP_MONO.join(ascii_frames))
                 
-                print(f"✓ Simple ASCII representation saved: {mono_output}")
-                
-                # Clean up
-                if os.path.exists(temp_frames):
-                    os.remove(temp_frames)
+                print(f"✓ Monochrome ASCII animation saved: {mono_output}")
         
         print("\n✓ ASCII art conversion completed!")
         print("\nTo get full ASCII art functionality, install:")
@@ -2830,8 +3490,14 @@ def ascii_art_converter(input_file):
         print("• sudo apt install jp2a           # For JPEG to ASCII")
         print("• sudo apt install caca-utils     # Alternative libcaca tools")
 
+# Frame separator lines written by the ASCII converter, in the order they are tried:
+# current colored/mono (60 chars), then legacy (20 chars)
+ASCII_FRAME_SEPARATOR_RES = tuple(re.compile(rb"(?m)^" + sep + rb"\n")
+                                  for sep in (rb"={60}", rb"-{60}", rb"={20}", rb"-{20}"))
+
 def play_ascii_art():
     """Play ASCII art files like animated GIFs in terminal."""
+    import mmap
     print("\n=== ASCII Art Player ===")
     print("This will play ASCII art files created by the ASCII converter.")
     
@@ -2852,35 +3518,30 @@ def play_ascii_art():
     print(f"\nLoading ASCII art file: {os.path.basename(ascii_file)}")
     
     try:
-        with open(ascii_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Detect frame separators and split into frames
-        frames = []
-        
-        # Try different separator patterns
-        if "=" * 60 in content:  # Our new colored ASCII separator
-            frames = content.split("=" * 60 + "\n")
-        elif "-" * 60 in content:  # Our new monochrome ASCII separator  
-            frames = content.split("-" * 60 + "\n")
-        elif "=" * 20 in content:  # Legacy colored ASCII separator
-            frames = content.split("=" * 20 + "\n")
-        elif "-" * 20 in content:  # Legacy monochrome ASCII separator  
-            frames = content.split("-" * 20 + "\n")
-        elif "\n\n" in content:  # Double newline separator
-            frames = content.split("\n\n")
-        else:
-            # Single frame or unknown format
-            frames = [content]
+        # Map the file instead of reading it into one big string; the regex engine scans the bytes directly
+        with open(ascii_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raw_frames = []
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Split on the first separator type that appears as a whole line
+                    for separator_re in ASCII_FRAME_SEPARATOR_RES:
+                        if separator_re.search(mm):
+                            raw_frames = separator_re.split(mm)
+                            break
+                    else:
+                        # Double newline separator, single frame or unknown format
+                        raw_frames = mm[:].split(b"\n\n")
         
         # Clean up frames
-        frames = [frame.strip() for frame in frames if frame.strip()]
+        frames = [frame.decode('utf-8', errors='replace').strip() for frame in raw_frames]
+        frames = [frame for frame in frames if frame]
         
         if len(frames) <= 1:
             print("This appears to be a static ASCII art file (single frame).")
             print("Displaying content:")
             print("-" * 50)
-            print(content)
+            print("\n\n".join(frames))
             print("-" * 50)
             return
         
@@ -2952,11 +3613,9 @@ def play_ascii_art():
     except Exception as e:
         print(f"Error reading ASCII file: {e}")
 
-def create_ascii_player_script():
-    """Create a standalone ASCII art player script."""
-    print("\n=== Create ASCII Player Script ===")
-    
-    script_content = '''#!/usr/bin/env python3
+# Standalone player written out by create_ascii_player_script. Kept inline so the
+# single-file install (setup.sh copies only this script) stays self-contained.
+ASCII_PLAYER_SCRIPT = '''#!/usr/bin/env python3
 """
 Standalone ASCII Art Player
 Usage: python3 ascii_player.py <ascii_file.txt> [fps]
@@ -2964,7 +3623,45 @@ Usage: python3 ascii_player.py <ascii_file.txt> [fps]
 
 import sys
 import os
+import re
 import time
+import queue
+import itertools
+import threading
+
+# Separator lines between frames (current 60-char and legacy 20-char styles)
+SEPARATOR = re.compile(r"^(?:={60}|-{60}|={20}|-{20})$")
+CLEAR_SCREEN = "\\033[2J\\033[H"
+
+def read_frames(filename, frame_q):
+    """Parse frames off disk into frame_q, finishing with None."""
+    try:
+        lines = []
+        found_separator = False
+        with open(filename, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                if SEPARATOR.match(line.rstrip("\\n")):
+                    found_separator = True
+                    frame = "".join(lines).strip()
+                    if frame:
+                        frame_q.put(frame)
+                    lines = []
+                else:
+                    lines.append(line)
+        
+        # Files without separator lines fall back to blank-line separated frames
+        rest = "".join(lines)
+        for frame in ([rest] if found_separator else rest.split("\\n\\n")):
+            if frame.strip():
+                frame_q.put(frame.strip())
+    finally:
+        frame_q.put(None)
+
+def write_all(data):
+    """Write straight to the stdout file descriptor, bypassing Python's buffering."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(1, view):]
 
 def play_ascii_file(filename, fps=2.0):
     """Play ASCII art file with animation."""
@@ -2972,41 +3669,51 @@ def play_ascii_file(filename, fps=2.0):
         print(f"File not found: {filename}")
         return
     
+    # The reader thread parses ahead of the display; the bounded queue caps how far
+    frame_q = queue.Queue(maxsize=8)
+    threading.Thread(target=read_frames, args=(filename, frame_q), daemon=True).start()
+    
+    frame_delay = 1.0 / fps
+    frames = []
+    loop_count = 0
+    
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Detect frames
-        frames = []
-        if "=" * 20 in content:
-            frames = content.split("=" * 20 + "\\n")
-        elif "-" * 20 in content:
-            frames = content.split("-" * 20 + "\\n")
-        elif "\\n\\n" in content:
-            frames = content.split("\\n\\n")
-        else:
-            frames = [content]
-        
-        frames = [frame.strip() for frame in frames if frame.strip()]
+        first_frames = [frame_q.get()]
+        if first_frames[0] is not None:
+            first_frames.append(frame_q.get())
         
-        if len(frames) <= 1:
+        if first_frames[-1] is None:
             print("Static ASCII art:")
             print("-" * 50)
-            print(content)
+            print(first_frames[0] or "")
             print("-" * 50)
             return
         
-        frame_delay = 1.0 / fps
-        print(f"Playing {len(frames)} frames at {fps} fps (Press Ctrl+C to stop)\\n")
+        print(f"Playing at {fps} fps (Press Ctrl+C to stop)\\n", flush=True)
+        deadline = time.perf_counter()
+        
+        def show(frame, position):
+            nonlocal deadline
+            header = f"Frame {position} | Loop {loop_count+1} | {fps} fps"
+            write_all(f"{CLEAR_SCREEN}{header}\\n{'-' * 50}\\n{frame}\\n".encode())
+            # Sleep until the next frame's deadline so display time doesn't accumulate drift
+            deadline += frame_delay
+            delay = deadline - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                deadline = time.perf_counter()
+        
+        # First loop plays frames as they arrive from the reader
+        for frame in itertools.chain(first_frames, iter(frame_q.get, None)):
+            frames.append(frame)
+            show(frame, len(frames))
+        loop_count += 1
         
-        loop_count = 0
+        # Later loops replay the frames already parsed
         while True:
             for i, frame in enumerate(frames):
-                print("\\033[2J\\033[H", end="")  # Clear screen
-                print(f"Frame {i+1}/{len(frames)} | Loop {loop_count+1} | {fps} fps")
-                print("-" * 50)
-                print(frame)
-                time.sleep(frame_delay)
+                show(frame, f"{i+1}/{len(frames)}")
             loop_count += 1
             
     except KeyboardInterrupt:
@@ -3025,6 +3732,10 @@ if __name__ == "__main__":
     
     play_ascii_file(filename, fps)
 '''
+
+def create_ascii_player_script():
+    """Create a standalone ASCII art player script."""
+    print("\n=== Create ASCII Player Script ===")
     
     script_path = safe_input("Enter path to save ASCII player script (default: ascii_player.py): ").strip()
     if not script_path:
@@ -3034,7 +3745,7 @@ if __name__ == "__main__":
     
     try:
         with open(script_path, 'w') as f:
-            f.write(script_content)
+            f.write(ASCII_PLAYER_SCRIPT)
         
         # Make executable
         os.chmod(script_path, 0o755)
@@ -3048,9 +3759,125 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"Error creating script: {e}")
 
-def datamoshing_effect(input_file):
-    """Create datamoshing effect by deliberately corrupting video compression."""
-    print(f"\n=== Datamoshing Effect: {os.path.basename(input_file)} ===")
+DATAMOSH_STYLES = {
+    "1": ("I-frame removal", "iframe"),
+    "2": ("Noise injection", "noise"),
+    "3": ("Motion vector corruption", "motion"),
+    "4": ("Combined", "combined"),
+}
+
+# Intensity choice -> (name, keep one I-frame per this many seconds, base noise level)
+DATAMOSH_INTENSITIES = {
+    "1": ("Mild", 10, 0.01),
+    "2": ("Medium", 5, 0.02),
+    "3": ("Heavy", 3, 0.05),
+    "4": ("Extreme", 2, 0.1),
+}
+
+# noise filter strength per (intensity, style); each style scales the base level differently
+DATAMOSH_NOISE = {
+    (intensity, style): int(noise_level * scale)
+    for intensity, (_, _, noise_level) in DATAMOSH_INTENSITIES.items()
+    for style, scale in (("2", 100), ("3", 50), ("4", 30))
+}
+
+# noise bitstream filter amount per intensity (lower corrupts more bytes)
+DATAMOSH_BSF_AMOUNT = {
+    intensity: int(100 / noise_level)
+    for intensity, (_, _, noise_level) in DATAMOSH_INTENSITIES.items()
+}
+
+def _datamosh_style_args(style_choice, intensity, use_nvenc=False):
+    """Return (video filter or None, encoder args) for one datamoshing style."""
+    if use_nvenc:
+        return _datamosh_nvenc_style_args(style_choice, intensity)
+    
+    iframe_interval = DATAMOSH_INTENSITIES[intensity][1]
+    # The output is deliberately corrupted, so x264's rate-distortion search is wasted work.
+    # Styles without a B-frame chain also get zerolatency; styles 1 and 4 need their -bf frames.
+    if style_choice == "2":
+        # Noise injection method
+        return (f"noise=alls={DATAMOSH_NOISE[intensity, style_choice]}:allf=t+u",
+                ["-c:v", "libx264", *X264_THREAD_ARGS, "-crf", "30",
+                 "-preset", "ultrafast", "-tune", "zerolatency"])
+    elif style_choice == "3":
+        # Motion vector corruption (using temporal noise)
+        return (f"noise=alls={DATAMOSH_NOISE[intensity, style_choice]}:allf=t,minterpolate=fps=30:mi_mode=mci:mc_mode=aobmc",
+                ["-c:v", "libx264", *X264_THREAD_ARGS, "-crf", "25",
+                 "-preset", "ultrafast", "-tune", "zerolatency"])
+    elif style_choice == "4":
+        # Combined effects
+        return (f"noise=alls={DATAMOSH_NOISE[intensity, style_choice]}:allf=t+u",
+                ["-c:v", "libx264", *X264_THREAD_ARGS, "-g", str(iframe_interval * 20), 
+                 "-bf", "3", "-b_strategy", "0", "-crf", "28",
+                 "-sc_threshold", "1000000", "-preset", "ultrafast"])
+    # I-frame removal method
+    return (None,
+            ["-c:v", "libx264", *X264_THREAD_ARGS, "-g", str(iframe_interval * 30), 
+             "-bf", "2", "-b_strategy", "0",
+             "-sc_threshold", "1000000", "-preset", "ultrafast"])
+
+def _datamosh_nvenc_style_args(style_choice, intensity):
+    """Return (video filter or None, h264_nvenc encoder args) for one datamoshing style."""
+    # Same GOP/B-frame structure as the libx264 styles; -cq stands in for -crf and
+    # -no-scenecut for -sc_threshold. The filters themselves have no CUDA versions.
+    video_filter, _ = _datamosh_style_args(style_choice, intensity)
+    iframe_interval = DATAMOSH_INTENSITIES[intensity][1]
+    if style_choice == "2":
+        return video_filter, ["-c:v", "h264_nvenc", "-preset", "p1", "-rc", "vbr", "-cq", "30"]
+    elif style_choice == "3":
+        return video_filter, ["-c:v", "h264_nvenc", "-preset", "p1", "-rc", "vbr", "-cq", "25"]
+    elif style_choice == "4":
+        return video_filter, ["-c:v", "h264_nvenc", "-preset", "p1", "-g", str(iframe_interval * 20),
+                              "-bf", "3", "-rc", "vbr", "-cq", "28", "-no-scenecut", "1"]
+    return video_filter, ["-c:v", "h264_nvenc", "-preset", "p1", "-g", str(iframe_interval * 30),
+                          "-bf", "2", "-no-scenecut", "1"]
+
+def _run_datamosh(build_cmd, duration_seconds):
+    """Run build_cmd(use_nvenc) on the GPU when h264_nvenc exists, falling back to libx264."""
+    if _ffmpeg_supports("-encoders", "h264_nvenc"):
+        print("Using NVIDIA GPU acceleration (h264_nvenc)")
+        try:
+            run_ffmpeg_with_progress(build_cmd(True), duration_seconds)
+            return
+        except subprocess.CalledProcessError:
+            print("NVENC encode failed - retrying on the CPU with libx264...")
+    run_ffmpeg_with_progress(build_cmd(False), duration_seconds)
+
+def datamoshing_effect_batch(input_file, style_outputs, intensity):
+    """Render several datamoshing styles from a single decode of input_file.
+    
+    style_outputs maps each style choice ("1"-"4") to its output path. The decoded
+    video is split once and every branch is filtered and encoded to its own output.
+    """
+    labels = [f"v{i}" for i in range(len(style_outputs))]
+    
+    def build_cmd(use_nvenc):
+        graph = [f"[0:v]split={len(labels)}" + "".join(f"[{label}]" for label in labels)]
+        output_args = []
+        for label, (style_choice, output_path) in zip(labels, style_outputs.items()):
+            video_filter, encoder_args = _datamosh_style_args(style_choice, intensity, use_nvenc)
+            graph.append(f"[{label}]{video_filter or 'null'}[{label}out]")
+            output_args += ["-map", f"[{label}out]", "-map", "0:a?", *encoder_args,
+                            "-c:a", "copy", "-y", output_path]
+        hwaccel_args = ["-hwaccel", "cuda"] if use_nvenc else []
+        return ["ffmpeg", *hwaccel_args, "-i", input_file,
+                "-filter_complex", ";".join(graph), *output_args]
+    
+    duration_seconds = get_video_info(input_file)['duration_seconds']
+    _run_datamosh(build_cmd, duration_seconds)
+
+# Height of the quick-look preview optionally rendered alongside a datamosh
+DATAMOSH_PREVIEW_HEIGHT = 360
+
+def datamoshing_effect(input_file, preview=None):
+    """Create datamoshing effect by deliberately corrupting video compression.
+    
+    If preview is None the user is asked whether to also write a low-res preview.
+    """
+    in_dir, in_name = os.path.split(input_file)
+    in_base, in_ext = os.path.splitext(in_name)
+    print(f"\n=== Datamoshing Effect: {in_name} ===")
     
     info = get_video_info(input_file)
     print(f"Duration: {info['duration']}")
@@ -3066,49 +3893,54 @@ def datamoshing_effect(input_file):
     
     intensity = safe_input("Choose intensity (1-4): ").strip()
     
-    if intensity == "1":
-        # Remove every 10th I-frame
-        iframe_interval = 10
-        noise_level = 0.01
-    elif intensity == "2":
-        # Remove every 5th I-frame
-        iframe_interval = 5
-        noise_level = 0.02
-    elif intensity == "3":
-        # Remove every 3rd I-frame
-        iframe_interval = 3
-        noise_level = 0.05
-    elif intensity == "4":
-        # Remove every 2nd I-frame
-        iframe_interval = 2
-        noise_level = 0.1
-    else:
+    if intensity not in DATAMOSH_INTENSITIES:
         print("Invalid choice. Using medium intensity.")
-        iframe_interval = 5
-        noise_level = 0.02
+        intensity = "2"
     
     print("\nDatamoshing Style:")
     print("1. I-frame removal (classic flowing effect)")
     print("2. Noise injection (digital corruption)")
     print("3. Motion vector corruption")
     print("4. Combined effects")
+    print("Tip: enter several styles (e.g. 1,3,4) to render them all from one decode")
     
     style_choice = safe_input("Choose style (1-4): ").strip()
+    # Keep the order given, drop duplicates and anything that isn't a style
+    batch_styles = [style for style in dict.fromkeys(style_choice.replace(" ", "").split(","))
+                    if style in DATAMOSH_STYLES]
+    if len(batch_styles) == 1:
+        style_choice = batch_styles[0]
     
     output_filename = safe_input("Enter output filename (with extension): ").strip()
     if not output_filename:
-        base_name = os.path.splitext(os.path.basename(input_file))[0]
-        output_filename = f"{base_name}_datamosh.mp4"
+        output_filename = f"{in_base}_datamosh.mp4"
         print(f"Using default filename: {output_filename}")
     
-    output_path = os.path.join(os.path.dirname(input_file), output_filename)
-    output_path = validate_output_path(output_path)
-    
     print(f"\n=== Datamoshing Summary ===")
-    print(f"Input: {os.path.basename(input_file)}")
-    print(f"Intensity: {['Mild', 'Medium', 'Heavy', 'Extreme'][int(intensity)-1]}")
-    print(f"Style: {['I-frame removal', 'Noise injection', 'Motion vector corruption', 'Combined'][int(style_choice)-1] if style_choice in ['1','2','3','4'] else 'I-frame removal'}")
-    print(f"Output: {os.path.basename(output_path)}")
+    print(f"Input: {in_name}")
+    print(f"Intensity: {DATAMOSH_INTENSITIES[intensity][0]}")
+    
+    if len(batch_styles) > 1:
+        out_base, out_ext = os.path.splitext(output_filename)
+        style_outputs = {}
+        for style in batch_styles:
+            style_name, style_slug = DATAMOSH_STYLES[style]
+            output_path = os.path.join(in_dir, f"{out_base}_{style_slug}{out_ext}")
+            style_outputs[style] = validate_output_path(output_path)
+            print(f"Style: {style_name} -> {os.path.basename(style_outputs[style])}")
+    else:
+        if preview is None:
+            preview = safe_input(f"Also create a {DATAMOSH_PREVIEW_HEIGHT}p preview in the same pass? (y/N): ").strip().lower() == 'y'
+        
+        output_path = os.path.join(in_dir, output_filename)
+        output_path = validate_output_path(output_path)
+        print(f"Style: {DATAMOSH_STYLES[style_choice][0] if style_choice in DATAMOSH_STYLES else 'I-frame removal'}")
+        print(f"Output: {os.path.basename(output_path)}")
+        
+        if preview:
+            out_base, out_ext = os.path.splitext(output_path)
+            preview_path = validate_output_path(f"{out_base}_preview{out_ext}")
+            print(f"Preview: {os.path.basename(preview_path)}")
     print("Note: Results are intentionally corrupted/glitched")
     
     confirm = safe_input("\nProceed with datamoshing? (y/N): ").strip().lower()
@@ -3118,51 +3950,74 @@ def datamoshing_effect(input_file):
     
     print("Creating datamosh effect...")
     try:
-        if style_choice == "1" or not style_choice in ["1", "2", "3", "4"]:
-            # I-frame removal method
-            print("Applying I-frame removal datamoshing...")
-            cmd = ["ffmpeg", "-i", input_file,
-                   "-c:v", "libx264", "-g", str(iframe_interval * 30), 
-                   "-bf", "2", "-b_strategy", "0",
-                   "-sc_threshold", "1000000", 
-                   "-c:a", "copy", "-y", output_path]
-            
-        elif style_choice == "2":
-            # Noise injection method
+        if len(batch_styles) > 1:
+            print(f"Applying {len(batch_styles)} datamoshing styles in one pass...")
+            datamoshing_effect_batch(input_file, style_outputs, intensity)
+            print(f"✓ Datamoshing effect completed successfully!")
+            for output_path in style_outputs.values():
+                print(f"Output saved: {output_path}")
+            return
+        
+        if style_choice == "2":
             print("Applying noise injection datamoshing...")
-            cmd = ["ffmpeg", "-i", input_file,
-                   "-vf", f"noise=alls={int(noise_level*100)}:allf=t+u",
-                   "-c:v", "libx264", "-crf", "30",
-                   "-c:a", "copy", "-y", output_path]
-            
         elif style_choice == "3":
-            # Motion vector corruption (using temporal noise)
             print("Applying motion vector corruption...")
-            cmd = ["ffmpeg", "-i", input_file,
-                   "-vf", f"noise=alls={int(noise_level*50)}:allf=t,minterpolate=fps=30:mi_mode=mci:mc_mode=aobmc",
-                   "-c:v", "libx264", "-crf", "25",
-                   "-c:a", "copy", "-y", output_path]
-            
         elif style_choice == "4":
-            # Combined effects
             print("Applying combined datamoshing effects...")
-            cmd = ["ffmpeg", "-i", input_file,
-                   "-vf", f"noise=alls={int(noise_level*30)}:allf=t+u",
-                   "-c:v", "libx264", "-g", str(iframe_interval * 20), 
-                   "-bf", "3", "-b_strategy", "0", "-crf", "28",
-                   "-sc_threshold", "1000000",
-                   "-c:a", "copy", "-y", output_path]
-        
-        subprocess.run(cmd, check=True, cwd=os.path.dirname(input_file))
+        else:
+            print("Applying I-frame removal datamoshing...")
+            
+            if not preview and get_video_codec(input_file) == "h264":
+                # H.264 sources can be glitched in the bitstream itself: the noise bitstream
+                # filter corrupts packet payloads and the result is remuxed, with no decode or encode
+                print("H.264 source - corrupting the bitstream directly (no re-encode)...")
+                cmd = ["ffmpeg", "-i", input_file, "-map", "0:v:0", "-map", "0:a?", "-c", "copy",
+                       "-bsf:v", f"noise=amount={DATAMOSH_BSF_AMOUNT[intensity]}", "-y", output_path]
+                try:
+                    run_ffmpeg_with_progress(cmd, info['duration_seconds'])
+                    print(f"✓ Datamoshing effect completed successfully!")
+                    print(f"Output saved: {output_path}")
+                    return
+                except subprocess.CalledProcessError:
+                    print("Bitstream corruption failed - falling back to re-encoding...")
+        
+        def build_cmd(use_nvenc):
+            video_filter, encoder_args = _datamosh_style_args(style_choice, intensity, use_nvenc)
+            # Frames are decoded on the GPU but downloaded, since noise/minterpolate are CPU filters
+            cmd = ["ffmpeg", "-hwaccel", "cuda"] if use_nvenc else ["ffmpeg"]
+            cmd += ["-i", input_file]
+            if preview:
+                # Decode and glitch once, then split the filtered frames into the full and preview encodes
+                graph = (f"[0:v]{video_filter or 'null'},split=2[full][small];"
+                         f"[small]scale=-2:{DATAMOSH_PREVIEW_HEIGHT}[preview]")
+                cmd += ["-filter_complex", graph,
+                        "-map", "[full]", "-map", "0:a?", *encoder_args, "-c:a", "copy", "-y", output_path,
+                        "-map", "[preview]", "-map", "0:a?",
+                        "-c:v", "libx264", *X264_THREAD_ARGS, "-preset", "ultrafast", "-crf", "32",
+                        "-c:a", "copy", "-y", preview_path]
+            else:
+                if video_filter:
+                    cmd += ["-vf", video_filter]
+                cmd += [*encoder_args, "-c:a", "copy", "-y", output_path]
+            return cmd
+        
+        _run_datamosh(build_cmd, info['duration_seconds'])
         print(f"✓ Datamoshing effect completed successfully!")
         print(f"Output saved: {output_path}")
+        if preview:
+            print(f"Preview saved: {preview_path}")
         
     except subprocess.CalledProcessError as e:
         print(f"✗ Error during datamoshing: {e}")
 
+# Speed-up followed by a weighted frame blend; formatted per run in timelapse_motion_trails
+TMIX_TRAILS_FILTER = "[0:v]setpts={pts:.6g}*PTS,fps=30[spedup];[spedup]tmix=frames={frames}:weights='{weights}'"
+
 def timelapse_motion_trails(input_file):
     """Create time-lapse with motion trails effect."""
-    print(f"\n=== Time-lapse with Motion Trails: {os.path.basename(input_file)} ===")
+    in_dir, in_name = os.path.split(input_file)
+    in_base, in_ext = os.path.splitext(in_name)
+    print(f"\n=== Time-lapse with Motion Trails: {in_name} ===")
     
     info = get_video_info(input_file)
     print(f"Duration: {info['duration']}")
@@ -3241,15 +4096,14 @@ def timelapse_motion_trails(input_file):
     
     output_filename = safe_input("Enter output filename (with extension): ").strip()
     if not output_filename:
-        base_name = os.path.splitext(os.path.basename(input_file))[0]
-        output_filename = f"{base_name}_timelapse_trails.mp4"
+        output_filename = f"{in_base}_timelapse_trails.mp4"
         print(f"Using default filename: {output_filename}")
     
-    output_path = os.path.join(os.path.dirname(input_file), output_filename)
+    output_path = os.path.join(in_dir, output_filename)
     output_path = validate_output_path(output_path)
     
     print(f"\n=== Time-lapse Motion Trails Summary ===")
-    print(f"Input: {os.path.basename(input_file)}")
+    print(f"Input: {in_name}")
     print(f"Speed: {speed_factor}x")
     print(f"Trail length: {trail_frames / 15:.1f} seconds")
     print(f"Trail intensity: {['Subtle', 'Medium', 'Strong'][int(intensity_choice)-1] if intensity_choice in ['1','2','3'] else 'Medium'}")
@@ -3268,19 +4122,18 @@ def timelapse_motion_trails(input_file):
         
         # Create motion trails using tmix filter with multiple inputs
         # The tmix filter blends multiple frames together to create trails
-        filter_complex = (
-            f"[0:v]setpts={pts_factor}*PTS,fps=30[spedup];"
-            f"[spedup]tmix=frames={trail_frames}:weights='{' '.join([str(trail_alpha ** i) for i in range(trail_frames)])}'"
-        )
+        # tmix lists weights oldest frame first, so the newest frame gets the full weight
+        weights = ' '.join(f"{trail_alpha ** age:.6g}" for age in reversed(range(trail_frames)))
+        filter_complex = TMIX_TRAILS_FILTER.format(pts=pts_factor, frames=trail_frames, weights=weights)
         
-        cmd = ["ffmpeg", "-i", input_file,
+        cmd = ["ffmpeg", "-filter_complex_threads", str(X264_THREADS), "-i", input_file,
                "-filter_complex", filter_complex,
-               "-c:v", "libx264", "-crf", "20",
+               "-c:v", "libx264", *X264_THREAD_ARGS, "-crf", "20",
                "-preset", "medium", "-pix_fmt", "yuv420p",
                "-c:a", "aac", "-b:a", "128k",
                "-y", output_path]
         
-        subprocess.run(cmd, check=True, cwd=os.path.dirname(input_file))
+        run_ffmpeg_with_progress(cmd, info['duration_seconds'] / speed_factor)
         print(f"✓ Time-lapse with motion trails completed successfully!")
         print(f"Output saved: {output_path}")
         
@@ -3288,6 +4141,147 @@ def timelapse_motion_trails(input_file):
         print(f"✗ Error during time-lapse creation: {e}")
         print("Note: This effect requires significant processing power and time")
 
+def _queue_padding_filter():
+    """Prompt for an Instagram padding preset; return (video filter, audio filter, duration factor)."""
+    print("1) Square (1080x1080)  2) Portrait (1080x1350)  3) Landscape (1080x566)  4) Story/Reel (1080x1920)")
+    sizes = {"1": (1080, 1080), "2": (1080, 1350), "3": (1080, 566), "4": (1080, 1920)}
+    size = sizes.get(safe_input("Choose a preset (1-4): ").strip())
+    if not size:
+        print("Invalid choice.")
+        return None
+    out_w, out_h = size
+    return (f"scale={out_w}:{out_h}:force_original_aspect_ratio=decrease,"
+            f"pad={out_w}:{out_h}:(ow-iw)/2:(oh-ih)/2:black", None, 1.0)
+
+def _queue_framerate_filter():
+    """Prompt for a target frame rate; return (video filter, audio filter, duration factor)."""
+    try:
+        fps = float(safe_input("Enter target frame rate (fps): ").strip())
+    except ValueError:
+        fps = 0
+    if fps <= 0 or fps > 120:
+        print("Frame rate must be between 0 and 120 fps.")
+        return None
+    return f"fps={fps}", None, 1.0
+
+def _queue_slowdown_filter():
+    """Prompt for a slowdown; return (video filter, audio filter, duration factor)."""
+    try:
+        speed_value = float(safe_input("Enter slowdown percentage or speed multiplier: ").strip())
+    except ValueError:
+        speed_value = 0
+    if 1 < speed_value <= 99:
+        speed_multiplier = 1 - (speed_value / 100)
+    elif 0 < speed_value <= 1:
+        speed_multiplier = speed_value
+    else:
+        print("Invalid input. Use percentage (1-99) or multiplier (0.01-1.0).")
+        return None
+    return f"setpts={1 / speed_multiplier}*PTS", f"atempo={speed_multiplier}", 1 / speed_multiplier
+
+# Editor operations that reduce to plain filters and can share one decode/encode pass
+QUEUEABLE_OPERATIONS = {
+    "5": ("Add black bars", _queue_padding_filter),
+    "8": ("Change frame rate", _queue_framerate_filter),
+    "9": ("Slow down video and audio", _queue_slowdown_filter),
+}
+
+def queue_operations(input_file):
+    """Chain several filter-based edits and apply them in a single ffmpeg pass."""
+    in_dir, in_name = os.path.split(input_file)
+    in_base, in_ext = os.path.splitext(in_name)
+    print(f"\n=== Queue Operations: {in_name} ===")
+    
+    info = get_video_info(input_file)
+    print(f"Duration: {info['duration']}")
+    print(f"Resolution: {info['resolution']}")
+    print(f"File size: {info['file_size']}")
+    print()
+    
+    queued = []
+    while True:
+        print("Queueable operations:")
+        for key, (label, _) in QUEUEABLE_OPERATIONS.items():
+            print(f"{key}. {label}")
+        print("0. Done - run the queue")
+        choice = safe_input(f"Add operation #{len(queued) + 1}: ").strip()
+        if choice == "0":
+            break
+        if choice not in QUEUEABLE_OPERATIONS:
+            print("Invalid choice.")
+            continue
+        label, build_filter = QUEUEABLE_OPERATIONS[choice]
+        filters = build_filter()
+        if filters:
+            queued.append((label, *filters))
+            print(f"Queued: {label}\n")
+    
+    if not queued:
+        print("No operations queued.")
+        return
+    
+    output_filename = safe_input("Enter output filename (with extension): ").strip()
+    if not output_filename:
+        output_filename = f"{in_base}_edited{in_ext}"
+        print(f"Using default filename: {output_filename}")
+    
+    output_path = os.path.join(in_dir, output_filename)
+    output_path = validate_output_path(output_path)
+    
+    print(f"\n=== Queue Summary ===")
+    print(f"Input: {in_name}")
+    for i, (label, video_filter, _, _) in enumerate(queued, 1):
+        print(f"{i}. {label} ({video_filter})")
+    print(f"Output: {os.path.basename(output_path)}")
+    
+    confirm = safe_input("\nProceed with queued operations? (y/N): ").strip().lower()
+    if confirm != 'y':
+        print("Operation cancelled.")
+        return
+    
+    video_chain = ",".join(video_filter for _, video_filter, _, _ in queued)
+    audio_chain = ",".join(audio_filter for _, _, audio_filter, _ in queued if audio_filter)
+    
+    # Slowdowns stretch the output; the progress counter needs the final duration
+    duration_seconds = info['duration_seconds']
+    for _, _, _, duration_factor in queued:
+        duration_seconds *= duration_factor
+    
+    cmd = ["ffmpeg", "-i", input_file]
+    if audio_chain:
+        cmd += ["-filter_complex", f"[0:v]{video_chain}[v];[0:a]{audio_chain}[a]",
+                "-map", "[v]", "-map", "[a]"]
+    else:
+        cmd += ["-vf", video_chain, "-c:a", "copy"]
+    cmd += ["-c:v", "libx264", *X264_THREAD_ARGS, "-y", output_path]
+    
+    print(f"Applying {len(queued)} operations in one pass...")
+    try:
+        run_ffmpeg_with_progress(cmd, duration_seconds)
+        print(f"✓ Queued operations completed successfully!")
+        print(f"Output saved: {output_path}")
+    except subprocess.CalledProcessError as e:
+        print(f"✗ Error during queued operations: {e}")
+
+# Editor menu choices mapped to the operation run on the selected file
+EDITOR_OPERATIONS = {
+    "1": trim_video,
+    "2": transcode_video,
+    "3": convert_format,
+    "4": convert_to_gif,
+    "5": add_padding,
+    "6": extract_audio,
+    "7": remove_audio,
+    "8": change_framerate,
+    "9": slow_down_video,
+    "11": ascii_art_converter,
+    "12": datamoshing_effect,
+    "13": timelapse_motion_trails,
+    "14": lambda _: play_ascii_art(),
+    "15": lambda _: create_ascii_player_script(),
+    "16": queue_operations,
+}
+
 def video_editor_menu():
     """Main video editor menu."""
     if not check_ffmpeg():
@@ -3312,6 +4306,7 @@ def video_editor_menu():
         print("7. Remove audio completely")
         print("8. Change frame rate")
         print("9. Slow down video and audio")
+        print("16. Queue several of 5, 8 and 9 (single re-encode)")
         print()
         print("=== Special Effects ===")
         print("11. ASCII Art Video Converter (terminal playback)")
@@ -3329,46 +4324,43 @@ def video_editor_menu():
         
         if operation == "99":
             break
-        elif operation == "1":
-            trim_video(selected_file)
-        elif operation == "2":
-            transcode_video(selected_file)
-        elif operation == "3":
-            convert_format(selected_file)
-        elif operation == "4":
-            convert_to_gif(selected_file)
-        elif operation == "5":
-            add_padding(selected_file)
-        elif operation == "6":
-            extract_audio(selected_file)
-        elif operation == "7":
-            remove_audio(selected_file)
-        elif operation == "8":
-            change_framerate(selected_file)
-        elif operation == "9":
-            slow_down_video(selected_file)
         elif operation == "10":
             continue  # Loop back to file selection
-        elif operation == "11":
-            ascii_art_converter(selected_file)
-        elif operation == "12":
-            datamoshing_effect(selected_file)
-        elif operation == "13":
-            timelapse_motion_trails(selected_file)
-        elif operation == "14":
-            play_ascii_art()
-        elif operation == "15":
-            create_ascii_player_script()
-        else:
+        
+        run_operation = EDITOR_OPERATIONS.get(operation)
+        if run_operation is None:
             print("Invalid choice.")
+            continue
         
-        if operation in ["1", "2", "3", "4", "5", "6", "7", "8", "9", "11", "12", "13", "14", "15"]:
-            # Ask if user wants to perform another operation on the same file
-            another = safe_input("\nPerform another operation on this file? (y/N): ").strip().lower()
-            if another != 'y':
-                break
+        run_operation(selected_file)
+        
+        # Ask if user wants to perform another operation on the same file
+        another = safe_input("\nPerform another operation on this file? (y/N): ").strip().lower()
+        if another != 'y':
+            break
 
     
+# Menus are written with a single stdout write each
+URL_ACTION_MENU = ("\nWhat would you like to do?\n"
+                   "1. Watch video (stream)\n"
+                   "2. Download video\n"
+                   "3. Download music\n"
+                   "4. Edit videos\n"
+                   "5. View file metadata\n"
+                   "6. Play ASCII art file\n"
+                   "99. Quit\n\n")
+VIDEO_DOWNLOAD_MENU = ("For video downloads, choose an option:\n"
+                       "1. Video with audio\n"
+                       "2. Video only (no audio)\n"
+                       "3. Audio only (extracted from video)\n")
+MAIN_MENU = ("\nSelect option:\n"
+             "1. Download video\n"
+             "2. Download music\n"
+             "3. Edit videos\n"
+             "4. View file metadata\n"
+             "5. Play ASCII art file\n"
+             "99. Quit\n\n")
+
 def main():
     # Check for help or config flags
     if len(sys.argv) > 1:
@@ -3391,26 +4383,23 @@ def main():
     if not check_dependencies():
         return
     
+    # Find browser cookies while the menu is on screen (never used for YouTube URLs)
+    if len(sys.argv) <= 1 or not is_youtube_url(sys.argv[1]):
+        preload_browser_cookies()
+    
     # Show configuration info
     config_file = find_config_file()
-    print("\nThanks for using Loutube! A wrapper for 'YT-DLP', making it easier to use!\n")
-    print("To find your downloads, go to:")
-    print(f"Videos are downloaded to: {DEFAULT_VIDEO_DIR}")
-    print(f"Music is downloaded to: {DEFAULT_MUSIC_DIR}")
+    sys.stdout.write("\nThanks for using Loutube! A wrapper for 'YT-DLP', making it easier to use!\n\n"
+                     "To find your downloads, go to:\n"
+                     f"Videos are downloaded to: {DEFAULT_VIDEO_DIR}\n"
+                     f"Music is downloaded to: {DEFAULT_MUSIC_DIR}\n")
     
-    # Browser cookies will be requested when needed (not upfront)
+    # Browser cookies are only added to yt-dlp commands when needed
     browser_cookies = None
     
     if len(sys.argv) > 1:
         url = sys.argv[1]
-        print("\nWhat would you like to do?")
-        print("1. Watch video (stream)")
-        print("2. Download video")
-        print("3. Download music")
-        print("4. Edit videos")
-        print("5. View file metadata")
-        print("6. Play ASCII art file")
-        print("99. Quit\n")
+        sys.stdout.write(URL_ACTION_MENU)
         action = safe_input("Enter your choice (1, 2, 3, 4, 5, 6, or 99): ").strip()
         print("")
         
@@ -3419,12 +4408,9 @@ def main():
             watch_video(url)
         elif action == "2":
             # Video download options
-            print("\nFor video downloads, choose an option:")
-            print("1. Video with audio")
-            print("2. Video only (no audio)")
-            print("3. Audio only (extracted from video)")
-            print("4. Download livestream from the beginning of the stream")
-            print("99. Quit\n")
+            sys.stdout.write("\n" + VIDEO_DOWNLOAD_MENU
+                             + "4. Download livestream from the beginning of the stream\n"
+                             "99. Quit\n\n")
             opt = safe_input("Enter your choice (1, 2, 3, 4, or 99): ").strip()
             print("")
             if opt == "1":
@@ -3456,13 +4442,7 @@ def main():
         else:
             print("Invalid choice. Exiting.")
     else:
-        print("\nSelect option:")
-        print("1. Download video")
-        print("2. Download music")
-        print("3. Edit videos")
-        print("4. View file metadata")
-        print("5. Play ASCII art file")
-        print("99. Quit\n")
+        sys.stdout.write(MAIN_MENU)
         choice = safe_input("Enter your choice (1, 2, 3, 4, 5, or 99): ").strip()
         print("")
         if choice not in ("1", "2", "3", "4", "5", "99"):
@@ -3487,11 +4467,7 @@ def main():
             if choice == "2":
                 download_audio(url)
             elif choice == "1":
-                print("For video downloads, choose an option:")
-                print("1. Video with audio")
-                print("2. Video only (no audio)")
-                print("3. Audio only (extracted from video)")
-                print("99. Quit\n")
+                sys.stdout.write(VIDEO_DOWNLOAD_MENU + "99. Quit\n\n")
                 opt = safe_input("Enter your choice (1, 2, 3, or 99): ").strip()
                 print("")
                 if opt == "1":